@@ -2,6 +2,7 @@
 
 from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 import os
 import configparser
@@ -25,6 +26,10 @@ VALID_STRUCTURE_SEARCH_TYPES = {"substructure", "duplicate",
 
 CORPORATE_BATCH_ID = "Corporate Batch ID"
 
+# Number of keep-alive connections each client session pools per host,
+# sized so concurrent requests on one session reuse connections
+SESSION_POOL_SIZE = 32
+
 def isBase64(s):
     """Checks if a string is base64 encoded.
     """
@@ -305,6 +310,9 @@ class client():
             'password': self.password
         }
         session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=SESSION_POOL_SIZE, pool_maxsize=SESSION_POOL_SIZE)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
         resp = session.post("{}/login".format(self.url),
                             headers={'Content-Type': 'application/json'},
                             data=json.dumps(data),
@@ -442,7 +450,7 @@ class client():
         """
         return self.add_files_to_lot(lot_corp_name, [{"file": file, "file_type": file_type, "writeup": writeup}])
 
-    def _get_cmpdreg_files_content(self, cmpdreg_lot_file_list):
+    def _get_cmpdreg_files_content(self, cmpdreg_lot_file_list, max_workers=10):
         """Get the content of cmpdreg files
 
         Pass the lot fileList array of array attribute of a cmpdreg metalot object to update or add the content attribute to each file
@@ -450,14 +458,20 @@ class client():
         Args:
             files: An array of dictionaries from the lot fileList attribute (attributes other than url are ignored)
                 "url": The url of the file to download
+            max_workers (int): The maximum number of files to download in parallel
 
         Returns:
             The the original array of dictionaries with the content attribute updated or added to each file
         """
-        for file in cmpdreg_lot_file_list:
+        def get_file_content(file):
             resp = self.session.get("{}/cmpdreg/MultipleFilePicker/{}".format(self.url, file["url"]))
             resp.raise_for_status()
             file["content"] = resp.content
+
+        # Download max_workers files in parallel
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the results so any download error is raised here
+            list(executor.map(get_file_content, cmpdreg_lot_file_list))
         return cmpdreg_lot_file_list
 
     def _upload_cmpdreg_files(self, lot_corp_name, files):
@@ -511,6 +525,10 @@ class client():
         resp = self.session.post("{}/cmpdreg/filesave".format(self.url),
                                  headers=headers,
                                  files=filesToUpload)
+        # Close the open files
+        for _, (_, value, *_) in filesToUpload:
+            if isinstance(value, IOBase):
+                value.close()
 
         resp.raise_for_status()
         return resp.json()
@@ -2513,10 +2531,12 @@ en array of protocols
         # Get the current aliases
         aliases = meta_lot['lot']['saltForm']['parent']['parentAliases']
         # Check existing aliasNames to see which we need to add
-        existing_aliases = [x['aliasName'] for x in aliases if not x['ignored']]
+        existing_aliases = {x['aliasName'] for x in aliases if not x['ignored']}
+        # Set of the new aliases for constant time membership checks
+        new_aliases = set(alias_list)
         # ignore aliases not in the alias_list
         for alias_obj in aliases:
-            if alias_obj['aliasName'] not in alias_list:
+            if alias_obj['aliasName'] not in new_aliases:
                 # Ignore aliases not in the new list
                 alias_obj['ignored'] = True
         # Add new ones
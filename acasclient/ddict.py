@@ -10,6 +10,7 @@ class DDict(object):
     can be referenced by an ACAS CodeValue.
     Any classes implementing this interface must implement the update_valid_values() method.
     The `update_valid_values` method must also be called before calling `check_value`
+    `valid_values` may be any container, but the built-in DDicts store a set so each `check_value` is a single lookup
     """
 
     EMPTY_DICTIONARY_MESSAGE = "The Data Dictionary you've tried to reference is currently empty. No valid values found for Code Type: {code_type}, Code Kind: {code_kind}, Code Origin: {code_origin}"
@@ -50,7 +51,7 @@ class ACASDDict(DDict):
         """Get the valid values for the DDict."""
         valid_codetables = client.get_ddict_values_by_type_and_kind(
             self.code_type, self.code_kind)
-        self.valid_values = [val_dict['code'] for val_dict in valid_codetables]
+        self.valid_values = {val_dict['code'] for val_dict in valid_codetables}
         if not self.valid_values:
             self.raise_empty_dict_error()
 
@@ -66,7 +67,7 @@ class ACASLsThingDDict(DDict):
     def update_valid_values(self, client):
         """Get the valid values for the DDict."""
         valid_codetables = client.get_ls_things_by_type_and_kind(self.code_type, self.code_kind, format='codetable')
-        self.valid_values = [val_dict['code'] for val_dict in valid_codetables]
+        self.valid_values = {val_dict['code'] for val_dict in valid_codetables}
         if not self.valid_values:
             self.raise_empty_dict_error()
 
@@ -82,7 +83,7 @@ class ACASAuthorDDict(DDict):
         """Get the valid values for the DDict."""
         valid_authors = client.get_authors()
         # Raise error if author does not match name
-        self.valid_values = [val_dict['code'] for val_dict in valid_authors]
+        self.valid_values = {val_dict['code'] for val_dict in valid_authors}
         if not self.valid_values:
             self.raise_empty_dict_error()
 
@@ -2038,9 +2038,10 @@ class SimpleLsThing(BaseModel):
         # Fetch the valid values from ACAS for each DDict once
         for ddict in ddicts.values():
             ddict.update_valid_values(client)
-        # Validate each model
+        # Validate each model, sharing check results so a code repeated across models is only checked once
+        check_results = {}
         for model in models:
-            result += model._validate_codevalues(ddicts)
+            result += model._validate_codevalues(ddicts, check_results)
         return result
 
     @classmethod
@@ -2168,13 +2169,17 @@ class SimpleLsThing(BaseModel):
         return ddicts
     
     @validation_result
-    def _validate_codevalues(self, ddicts):
+    def _validate_codevalues(self, ddicts, check_results=None):
         """Confirm all CodeValues have valid values.
         Note: validation is skipped if a CodeValue's code_origin is None
 
         :param ddicts: dict of (code_type, code_kind, code_origin): DDict. Should come from _get_ddicts()
         :type ddicts: dict
+        :param check_results: dict of ((code_type, code_kind, code_origin), code): ValidationResult to reuse, defaults to None
+        :type check_results: dict, optional
         """
+        if check_results is None:
+            check_results = {}
         result = ValidationResult(True, [])
         state_dicts = [self.metadata, self.results]
         for state_dict in state_dicts:
@@ -2183,10 +2188,14 @@ class SimpleLsThing(BaseModel):
                     if isinstance(value, CodeValue):
                         if value.code and value.code_origin:
                             # Get the corresponding DDict
-                            ddict = ddicts.get((value.code_type, value.code_kind, value.code_origin.upper()), None)
+                            ddict_key = (value.code_type, value.code_kind, value.code_origin.upper())
+                            ddict = ddicts.get(ddict_key, None)
                             if ddict:
                                 # Confirm this CodeValue's code exists in the DDict
-                                result += ddict.check_value(value.code)
+                                check_key = (ddict_key, value.code)
+                                if check_key not in check_results:
+                                    check_results[check_key] = ddict.check_value(value.code)
+                                result += check_results[check_key]
                             else:
                                 result += ValidationResult(True, f"Cannot locate DDict with code_type={value.code_type}, code_kind={value.code_kind}, code_origin={value.code_origin}")
         return result
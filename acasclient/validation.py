@@ -1,5 +1,5 @@
 import decorator
-from collections import defaultdict
+from collections import Counter
 from typing import List
 
 # Author: Anand Kumar
@@ -25,9 +25,10 @@ class ValidationResult(object):
 
     def __init__(self, is_valid: bool, messages: List[str] = None, errors: List[str] = None, warnings: List[str] = None, summaries: List[str] = None):
         self._is_valid = is_valid
-        self._errors = errors or []
-        self._warnings = warnings or []
-        self._summaries = summaries or []
+        # Copy the message lists as they are extended in place by __iadd__
+        self._errors = list(errors or [])
+        self._warnings = list(warnings or [])
+        self._summaries = list(summaries or [])
         # For simple messages, classify them as errors or warnings based on the validity of the result
         if messages:
             if is_valid:
@@ -61,6 +62,14 @@ class ValidationResult(object):
         summaries = self._summaries + other._summaries
         return ValidationResult(is_valid=is_valid, errors=errors, warnings=warnings, summaries=summaries)
 
+    def __iadd__(self, other):
+        # Accumulate into this result rather than copying every message list on each addition
+        self._is_valid = self._is_valid and other._is_valid
+        self._errors.extend(other._errors)
+        self._warnings.extend(other._warnings)
+        self._summaries.extend(other._summaries)
+        return self
+
     def get_messages(self) -> List[str]:
         return self._errors + self._warnings + self._summaries
     
@@ -121,16 +130,9 @@ def _dedupe_messages(messages: List[str]) -> List[str]:
     :return: list of deduplicated messages
     :rtype: list
     """
-    messages_dict = defaultdict(int)
-    for msg in messages:
-        messages_dict[msg] += 1
-    deduped_messages = []
-    for msg, count in messages_dict.items():
-        if count > 1:
-            deduped_messages.append(f'{count} occurrences of: {msg}')
-        else:
-            deduped_messages.append(msg)
-    return deduped_messages
+    # Counter keeps messages in first-seen order
+    return [f'{count} occurrences of: {msg}' if count > 1 else msg
+            for msg, count in Counter(messages).items()]
 
 def get_validation_response(validation_result, ls_thing=None, commit=False, transaction_id=-1) -> dict:
     """
@@ -183,46 +185,48 @@ def get_validation_response(validation_result, ls_thing=None, commit=False, tran
     return resp_dict
 
 
-def _get_html_summary(errors, warnings, summaries, commit) -> str:
-    """
-    Format HTML summary for the validation result.
-    """
-    # Lay out HTML template structure
-    HTML_SUMMARY_TEMPLATE = """<p>{instructions}</p>
+# HTML summary templates
+HTML_SUMMARY_TEMPLATE = """<p>{instructions}</p>
     {errors_block}
     {warnings_block}
     {summary_block}
     """
-    ERRORS_TEMPLATE = """<h4 style=\"color:red\">Errors: {count} </h4>
+ERRORS_TEMPLATE = """<h4 style=\"color:red\">Errors: {count} </h4>
     <ul>{message_list}</ul>
     """
-    WARNINGS_TEMPLATE = """<h4>Warnings: {count} </h4>
+WARNINGS_TEMPLATE = """<h4>Warnings: {count} </h4>
     <p>Warnings provide information on issues found in the uploaded data. You can proceed with warnings; however, it is recommended that, if possible, you make the changes suggested by the warnings and upload a new version of the data by using the 'Back' button at the bottom of this screen.<p>
     <ul>{message_list}</ul>"""
-    SUMMARY_TEMPLATE = """<h4>Summary</h4>
+SUMMARY_TEMPLATE = """<h4>Summary</h4>
     <p>Information:</p>
     <ul>{message_list}</ul>"""
-    MESSAGE_TEMPLATE = """<li>{message}</li>"""
+MESSAGE_TEMPLATE = """<li>{message}</li>"""
+
+
+def _format_message_list(messages: List[str]) -> str:
+    """
+    Format messages as HTML list items.
+    """
+    return '\n'.join(MESSAGE_TEMPLATE.format(message=message) for message in messages)
 
+
+def _get_html_summary(errors, warnings, summaries, commit) -> str:
+    """
+    Format HTML summary for the validation result.
+    """
     # Set up variables
     instructions = ''
     errors_block = ''
     warnings_block = ''
     summary_block = ''
     if errors:
-        error_messages = '\n'.join(
-            [MESSAGE_TEMPLATE.format(message=error) for error in errors])
         errors_block = ERRORS_TEMPLATE.format(
-            count=len(errors), message_list=error_messages)
+            count=len(errors), message_list=_format_message_list(errors))
     if warnings:
-        warnings_messages = '\n'.join(
-            [MESSAGE_TEMPLATE.format(message=warning) for warning in warnings])
         warnings_block = WARNINGS_TEMPLATE.format(
-            count=len(warnings), message_list=warnings_messages)
+            count=len(warnings), message_list=_format_message_list(warnings))
     if summaries:
-        summary_messages = '\n'.join(
-            [MESSAGE_TEMPLATE.format(message=summary) for summary in summaries])
-        summary_block = SUMMARY_TEMPLATE.format(message_list=summary_messages)
+        summary_block = SUMMARY_TEMPLATE.format(message_list=_format_message_list(summaries))
     if commit:
         instructions = 'Upload completed.'
         # hide warnings and errors if we've already committed
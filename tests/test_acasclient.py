@@ -9,17 +9,21 @@ from pathlib import Path
 import tempfile
 import shutil
 import uuid
+import secrets
 import json
+import hashlib
+import re
 import operator
-import signal
 import requests
 from typing import List, Dict, Any, Optional
-from csv import DictReader
+import csv
 from acasclient.experiment import Experiment
 from acasclient.acasclient import (get_entity_value_by_state_type_kind_value_type_kind)
 import zipfile
+from io import StringIO
 from acasclient.selfile import Generic
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
 # Import project ls thing
 from datetime import datetime
@@ -38,20 +42,142 @@ M  END
 
 ACAS_NODEAPI_BASE_URL = "http://localhost:3001"
 
+# Directory holding the test data files, resolved once at import
+TEST_DATA_DIR = Path(__file__).resolve().parent.joinpath('test_acasclient')
+SWAP_PARENT_STRUCTURES_SDF = TEST_DATA_DIR.joinpath('test_005_swap_parent_structures.sdf')
+
 BASIC_EXPERIMENT_LOAD_EXPERIMENT_NAME = "EXPERIMENT_BLAH"
 BASIC_EXPERIMENT_LOAD_PROTOCOL_NAME = "PROTOCOL_BLAH"
 STEREO_CATEGORY="Unknown"
-class Timeout:
-    def __init__(self, seconds=1, error_message='Timeout'):
-        self.seconds = seconds
-        self.error_message = error_message
-    def handle_timeout(self, signum, frame):
-        raise TimeoutError(self.error_message)
-    def __enter__(self):
-        signal.signal(signal.SIGALRM, self.handle_timeout)
-        signal.alarm(self.seconds)
-    def __exit__(self, type, value, traceback):
-        signal.alarm(0)
+
+# SDF registration mappings shared by the CmpdReg tests, composed into per test mapping lists
+# These are sent as-is in the register_sdf request so treat them as read-only
+PARENT_CORP_NAME_MAPPING = {
+    "dbProperty": "Parent Corp Name",
+    "defaultVal": None,
+    "required": False,
+    "sdfProperty": "Parent Corp Name"
+}
+LOT_CORP_NAME_MAPPING = {
+    "dbProperty": "Lot Corp Name",
+    "defaultVal": None,
+    "required": False,
+    "sdfProperty": "Lot Corp Name"
+}
+LOT_NUMBER_MAPPING = {
+    "dbProperty": "Lot Number",
+    "defaultVal": None,
+    "required": False,
+    "sdfProperty": "Lot Number"
+}
+LOT_CHEMIST_MAPPING = {
+    "dbProperty": "Lot Chemist",
+    "defaultVal": "bob",
+    "required": True,
+    "sdfProperty": None
+}
+PARENT_STEREO_CATEGORY_MAPPING = {
+    "dbProperty": "Parent Stereo Category",
+    "defaultVal": STEREO_CATEGORY,
+    "required": True,
+    "sdfProperty": None
+}
+PARENT_STEREO_COMMENT_MAPPING = {
+    "dbProperty": "Parent Stereo Comment",
+    "defaultVal": None,
+    "required": False,
+    "sdfProperty": "Parent Stereo Comment"
+}
+PARENT_ALIAS_MAPPING = {
+    "dbProperty": "Parent Alias",
+    "defaultVal": None,
+    "required": False,
+    "sdfProperty": "Parent Alias"
+}
+
+def project_mapping(project_code):
+    return {
+        "dbProperty": "Project",
+        "defaultVal": project_code,
+        "required": True,
+        "sdfProperty": "Project Code Name"
+    }
+
+# Expected experiment loader messages, shared read-only across test runs
+EXPECTED_MESSAGES_BASIC_XLS_1995 = (
+    {
+        "errorLevel": "error",
+        "message": "Cannot read input excel file: OldExcelFormatException (Java): The supplied spreadsheet seems to be Excel 5.0/7.0 (BIFF5) format. POI only supports BIFF8 format (from Excel versions 97/2000/XP/2003)"
+    },
+)
+
+EXPECTED_MESSAGES_CURVE_VALIDATION = (
+    {
+        "errorLevel": "error",
+        "message": "No 'Rendering Hint' was found for curve id '9629'. If a curve id is specified, it must be associated with a Rendering Hint."
+    },
+    {
+        "errorLevel": "error",
+        "message": "Could not find `Calculated Results` match for `Raw Results` links: 'g'"
+    },
+    {
+        "errorLevel": "warning",
+        "message": "A date is not in the proper format. Found: \"5/8/15\" This was interpreted as \"2015-08-05\". Please enter dates as YYYY-MM-DD."
+    },
+    {
+        "errorLevel": "warning",
+        "message": "For curve ids: '126915'. The following numeric parameters were not found: Slope, Min, Max, EC50. Please provide numeric values for these parameters so that curves are drawn properly."
+    },
+    {
+        "errorLevel": "warning",
+        "message": "For curve ids: '126933','126934'. The following numeric parameters were not found: Slope, Max. Please provide numeric values for these parameters so that curves are drawn properly."
+    },
+    {
+        "errorLevel": "warning",
+        "message": "For curve ids: '8788'. The following numeric parameters were not found: Slope. Please provide numeric values for these parameters so that curves are drawn properly."
+    },
+    {
+        "errorLevel": "warning",
+        "message": "For curve ids: '8836'. The following numeric parameters were not found: Min. Please provide numeric values for these parameters so that curves are drawn properly."
+    },
+    {
+        "errorLevel": "warning",
+        "message": "For curve ids: '9629'. The following numeric parameters were not found: EC50. Please provide numeric values for these parameters so that curves are drawn properly."
+    },
+    {
+        "errorLevel": "warning",
+        "message": "For curve ids: 'a','b','c'. The R&#178; is < than the threshold value of 0.9."
+    },
+    {
+        "errorLevel": "warning",
+        "message": "For curve ids: 'f','8806'. The following numeric parameters were not found: Max. Please provide numeric values for these parameters so that curves are drawn properly."
+    },
+)
+
+EXPECTED_MESSAGES_INF_AS_NUMERIC = (
+    {
+        "errorLevel": "error",
+        "message": "The following values are expected to be numbers but are: 'Inf', '-Inf'. Please represent large number values using operators. For example, > 10000 or < -10000."
+    },
+)
+
+EXPECTED_MESSAGES_NUMBER_PARSING = (
+    {
+        "errorLevel": "warning",
+        "message": "The following Number values contain numerals but could not be parsed as Number so will be saved as Text: 'Test1.0Test', '1.0Test', 'Test1.0'. To avoid this warning either remove all numerals from the text, or use a correctly formatted Number. For example, 1, 1.2, 1.23e-10, >1, <1"
+    },
+)
+
+def run_with_timeout(seconds, func, *args, **kwargs):
+    # Runs func in a worker thread and raises TimeoutError if it has not returned within the given number of seconds
+    # Unlike SIGALRM this works off the main thread and on Windows, but a call which times out is left to finish in the background
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        return executor.submit(func, *args, **kwargs).result(timeout=seconds)
+    except FuturesTimeoutError:
+        raise TimeoutError(f"Timed out after {seconds} seconds")
+    finally:
+        executor.shutdown(wait=False)
 
 # Code to anonymize experiments for testing
 def remove_common(object):
@@ -104,13 +230,13 @@ def clean_group(group):
             # later by the key (this is for diffing puroses as part of the test)
             elif value['lsKind'] == "Key":
                 group['key'] = value['numericValue']
-        state["lsValues"] = sorted(state["lsValues"], key=operator.itemgetter('lsKind','ignored'))
+        state["lsValues"].sort(key=operator.itemgetter('lsKind','ignored'))
 
-    group["lsStates"] = sorted(group["lsStates"], key=operator.itemgetter('lsType','lsKind','ignored'))
+    group["lsStates"].sort(key=operator.itemgetter('lsType','lsKind','ignored'))
     return group
     
 def anonymize_experiment_dict(experiment):
-    # Anonymizes an experiment by removing keys which are subject to change each time the experiment is loaded
+    # Anonymizes an experiment in place by removing keys which are subject to change each time the experiment is loaded
     # It also sorts the analysis groups by an analysis group value lsKind "Key" if present in the upload file
     # This key was added to the Dose Response upload file for these testing purposes
     for analysis_group in experiment["analysisGroups"]:
@@ -123,7 +249,7 @@ def anonymize_experiment_dict(experiment):
         #     clean_group(tg)
         #     for sg in tg["subjects"]:
         #         clean_group(sg)
-    experiment["analysisGroups"] = sorted(experiment["analysisGroups"], key=operator.itemgetter('key'))
+    experiment["analysisGroups"].sort(key=operator.itemgetter('key'))
     return experiment
 
 def create_project_thing(code, name=None, alias=None):
@@ -213,8 +339,7 @@ def create_thing_with_blob_value(code):
 
     # Get a file to load
     file_name = 'blob_test.png'
-    blob_test_path = Path(__file__).resolve().parent\
-        .joinpath('test_acasclient', file_name)
+    blob_test_path = TEST_DATA_DIR.joinpath(file_name)
     f = open(blob_test_path, "rb")
     bytes_array = f.read()
 
@@ -353,17 +478,33 @@ def requires_basic_experiment_load(func):
         return func(self, current_experiment)
     return wrapper
 
-def read_registered_csv(bulk_loader_response: dict) -> List[dict]:
+def read_registered_corp_names(bulk_loader_response: dict) -> List[str]:
     """
-    Reads the registered.csv file from the bulk loader response and returns a list of dicts
+    Reads the registered.csv file from the bulk loader response and returns the list of registered corp names
     """
     report_files = bulk_loader_response['report_files']
     for report_file in report_files:
         if report_file['name'].endswith('registered.csv'):
-            reader = DictReader(report_file['content'].decode('utf-8').splitlines())
-            return list(reader)
+            rows = csv.reader(report_file['content'].decode('utf-8').splitlines())
+            # Only the corp name column is needed so look up its index once from the header row
+            corp_name_index = next(rows).index('Corp Name in DB')
+            return [row[corp_name_index] for row in rows]
     return []
 
+def append_sdf_properties(mol: str, properties: dict) -> str:
+    """
+    Returns the molfile with an SDF data item for each of the properties inserted after "M  END"
+    """
+    head, sep, tail = mol.partition("M  END")
+    data_items = ''.join(f"\n> <{name}>\n{value}\n" for name, value in properties.items())
+    return head + sep + data_items + tail
+
+def parent_sdf_record(mol: str, parent_alias: str) -> str:
+    """
+    Returns the molfile as an SDF record for a new parent with the parent alias and a unique stereo comment
+    """
+    return append_sdf_properties(mol, {"Parent Alias": parent_alias, "Parent Stereo Comment": secrets.token_hex(8)})
+
 class BaseAcasClientTest(unittest.TestCase):
     """ Base class for ACAS Client tests """
 
@@ -427,6 +568,8 @@ class BaseAcasClientTest(unittest.TestCase):
             print("Successfully deleted all projects (except Global)")
         except Exception as e:
             print("Error deleting all projects in tear down: " + str(e))
+        self._shared_restricted_project = None
+        self._shared_role_users = None
 
         try:    
             for username in self.test_usernames:
@@ -451,6 +594,30 @@ class BaseAcasClientTest(unittest.TestCase):
         user_client = acasclient.client(user_creds)
         return user_client
 
+    # Cached cmpdreg bulk load file listing, cleared whenever this class loads or purges bulk load files
+    _bulk_load_files_cache = {}
+
+    def get_cached_cmpdreg_bulk_load_files(self):
+        """ Returns the cmpdreg bulk load files, fetching them only if they haven't been fetched since the last load or purge """
+        if 'files' not in self._bulk_load_files_cache:
+            self._bulk_load_files_cache['files'] = self.client.get_cmpdreg_bulk_load_files()
+        return self._bulk_load_files_cache['files']
+
+    # Keyword names for the counts reported in a bulk load summary
+    SUMMARY_COUNT_LABELS = {
+        'processed': 'Number of entries processed',
+        'errors': 'Number of entries with error',
+        'warnings': 'Number of warnings',
+        'new_compounds': 'New compounds',
+        'new_lots': 'New lots of existing compounds',
+    }
+
+    def assert_summary_counts(self, summary, *messages, **counts):
+        """ Assert the bulk load summary reports each of the counts and includes each of the messages"""
+        expected = [f"{self.SUMMARY_COUNT_LABELS[name]}: {count}" for name, count in counts.items()]
+        expected.extend(messages)
+        self.assertEqual([], [line for line in expected if line not in summary], summary)
+
     def verify_file_and_content_equal(self, file_path, content):
         """ Compare the content to the file contents"""
         mode = 'rb' if isinstance(content, bytes) else 'r'
@@ -614,6 +781,7 @@ class BaseAcasClientTest(unittest.TestCase):
 
     def delete_all_cmpd_reg_bulk_load_files(self):
         """ Deletes all cmpdreg bulk load files in order by id """
+        self._bulk_load_files_cache.clear()
 
         files = self.client.\
             get_cmpdreg_bulk_load_files()
@@ -682,9 +850,35 @@ class BaseAcasClientTest(unittest.TestCase):
         self.client.setup_items("lsroles", [ls_role])
         return newProject
 
+    def get_shared_restricted_project(self):
+        """ Returns a restricted project with roles which is created once and shared by the tests of a class """
+        cls = type(self)
+        if cls.__dict__.get('_shared_restricted_project') is None:
+            cls._shared_restricted_project = self.create_basic_project_with_roles()
+        return cls._shared_restricted_project
+
+    def get_shared_role_users(self):
+        """ Returns a dict of connected user clients covering the acas/cmpdreg role permutations, with and without
+        access to the shared restricted project. The users are created once and shared by the tests of a class """
+        cls = type(self)
+        if cls.__dict__.get('_shared_role_users') is None:
+            project_names = [self.get_shared_restricted_project().names[PROJECT_NAME]]
+            user_specs = {
+                'cmpdreg_user': dict(prefix="cmpdreg-user-", acas_user=False, acas_admin=False, creg_user=True, creg_admin=False),
+                'cmpdreg_user_with_restricted_project_acls': dict(prefix="cmpdreg-user-acls-", acas_user=False, acas_admin=False, creg_user=True, creg_admin=False, project_names=project_names),
+                'acas_user': dict(prefix="acas-user-", acas_user=True, acas_admin=False, creg_user=False, creg_admin=False),
+                'acas_user_restricted_project_acls': dict(prefix="acas-user-acls-", acas_user=True, acas_admin=False, creg_user=False, creg_admin=False, project_names=project_names),
+                'acas_admin': dict(prefix="acas-admin-", acas_user=True, acas_admin=True, creg_user=False, creg_admin=False),
+                'cmpdreg_admin': dict(prefix="cmpdreg-admin-", acas_user=False, acas_admin=False, creg_user=True, creg_admin=True),
+            }
+            # The users are independent so create them concurrently
+            with ThreadPoolExecutor(max_workers=len(user_specs)) as executor:
+                futures = {name: executor.submit(self.create_and_connect_backdoor_user, **spec) for name, spec in user_specs.items()}
+                cls._shared_role_users = {name: future.result() for name, future in futures.items()}
+        return cls._shared_role_users
+
     def basic_experiment_load(self):
-        data_file_to_upload = Path(__file__).resolve()\
-                        .parent.joinpath('test_acasclient', 'uniform-commas-with-quoted-text.csv')
+        data_file_to_upload = TEST_DATA_DIR.joinpath('uniform-commas-with-quoted-text.csv')
         response = self.client.\
             experiment_loader(data_file_to_upload, "bob", False)
         return response
@@ -695,8 +889,7 @@ class BaseAcasClientTest(unittest.TestCase):
             project_code = self.global_project_code
         
         if file is None:
-            file = Path(__file__).resolve().parent\
-                .joinpath('test_acasclient', 'test_012_register_sdf.sdf')
+            file = TEST_DATA_DIR.joinpath('test_012_register_sdf.sdf')
 
 
         mappings = [
@@ -866,6 +1059,7 @@ class BaseAcasClientTest(unittest.TestCase):
 
         response = self.client.register_sdf(file, "bob",
                                             mappings)
+        self._bulk_load_files_cache.clear()
         return response
 
 
@@ -908,6 +1102,19 @@ class BaseAcasClientTest(unittest.TestCase):
 
         return restricted_lot_corp_name
 
+    def get_latest_lot_corp_name(self):
+        # Get the corp name of the lot with the highest id
+        # This is because we dont' get the corp id in the response from the bulkload
+        return max(self.client.get_all_lots(), key=operator.itemgetter('id'))['lotCorpName']
+
+    def create_restricted_lot_with_experiment(self, project, file_name='4 parameter D-R.csv'):
+        # Create a restricted lot and load an experiment to the restricted project using it
+        restricted_lot_corp_name = self.create_restricted_lot(project.code_name)
+        file_to_upload = get_basic_experiment_load_file(self.tempdir, project.names[PROJECT_NAME], restricted_lot_corp_name, file_name=file_name)
+        response = self.client.\
+            experiment_loader(file_to_upload, "bob", False)
+        return restricted_lot_corp_name, response['results']['experimentCode']
+
     def check_lot_exists_in_experiment(self, lot_corp_name, experiment_code_name):
         experiment = self.client.get_experiment_by_code(experiment_code_name, full = True)
         # when experiment is deleted, the analysis groups for the lot are deleted
@@ -925,9 +1132,7 @@ class TestAcasclient(BaseAcasClientTest):
 
     def test_000_creds_from_file(self):
         """Test creds from file."""
-        file_credentials = Path(__file__).resolve().\
-            parent.joinpath('test_acasclient',
-                            'test_000_creds_from_file_credentials')
+        file_credentials = TEST_DATA_DIR.joinpath('test_000_creds_from_file_credentials')
         creds = acasclient.creds_from_file(
             file_credentials,
             'acas')
@@ -974,8 +1179,7 @@ class TestAcasclient(BaseAcasClientTest):
 
     def test_004_upload_files(self):
         """Test upload files."""
-        test_003_upload_file_file = Path(__file__).resolve().parent.\
-            joinpath('test_acasclient', '1_1_Generic.xlsx')
+        test_003_upload_file_file = TEST_DATA_DIR.joinpath('1_1_Generic.xlsx')
         files = self.client.upload_files([test_003_upload_file_file])
         self.assertIn('files', files)
         self.assertIn('name', files['files'][0])
@@ -985,8 +1189,7 @@ class TestAcasclient(BaseAcasClientTest):
     @requires_absent_basic_cmpd_reg_load
     def test_005_register_sdf_request(self):
         """Test register sdf request."""
-        test_012_upload_file_file = Path(__file__).resolve().parent\
-            .joinpath('test_acasclient', 'test_012_register_sdf.sdf')
+        test_012_upload_file_file = TEST_DATA_DIR.joinpath('test_012_register_sdf.sdf')
         files = self.client.upload_files([test_012_upload_file_file])
         request = {
             "fileName": files['files'][0]["name"],
@@ -1356,7 +1559,7 @@ class TestAcasclient(BaseAcasClientTest):
             export_cmpd_search_results(search_results)
         self.assertIn('reportFilePath', search_results_export)
         self.assertIn('summary', search_results_export)
-        self.assertEquals(search_results_export['summary'], "Successfully exported 1 lots.")
+        self.assertEqual(search_results_export['summary'], "Successfully exported 1 lots.")
         search_results_export = self.client.\
             get_file(search_results_export['reportFilePath'])
 
@@ -1391,8 +1594,7 @@ class TestAcasclient(BaseAcasClientTest):
     @requires_basic_cmpd_reg_load
     def test_013_experiment_loader_request(self):
         """Test experiment loader request."""
-        data_file_to_upload = Path(__file__).\
-            resolve().parent.joinpath('test_acasclient', '1_1_Generic.xlsx')
+        data_file_to_upload = TEST_DATA_DIR.joinpath('1_1_Generic.xlsx')
         files = self.client.upload_files([data_file_to_upload])
         request = {"user": "bob",
                    "fileToParse": files['files'][0]["name"],
@@ -1607,8 +1809,7 @@ class TestAcasclient(BaseAcasClientTest):
         self.assertIsNone(results)
         sd_filename = 'test_012_register_sdf.sdf'
 
-        test_012_upload_file_file = Path(__file__).resolve().parent\
-            .joinpath('test_acasclient', sd_filename)
+        test_012_upload_file_file = TEST_DATA_DIR.joinpath(sd_filename)
         mappings = [{
             "dbProperty": "Parent Stereo Category",
             "defaultVal": "Unknown",
@@ -1622,7 +1823,7 @@ class TestAcasclient(BaseAcasClientTest):
         bulk_load_files = self.client.get_cmpdreg_bulk_load_files()
         this_blf = [blf for blf in bulk_load_files if blf["id"] == registration_result["id"]][0]
         self.assertIn('originalFileName', this_blf)
-        self.assertEquals(this_blf['originalFileName'], sd_filename)
+        self.assertEqual(this_blf['originalFileName'], sd_filename)
 
         # purge the bulk load file
         results = self.client.\
@@ -1632,7 +1833,7 @@ class TestAcasclient(BaseAcasClientTest):
         self.assertIn('success', results)
         self.assertTrue(results['success'])
         self.assertIn('originalFileName', results)
-        self.assertEquals(results['originalFileName'], sd_filename)
+        self.assertEqual(results['originalFileName'], sd_filename)
 
     @requires_basic_experiment_load
     def test_025_delete_experiment(self, experiment):
@@ -1931,7 +2132,7 @@ class TestAcasclient(BaseAcasClientTest):
         # Should return more than 0 lots
         all_lots_for_project = self.client.get_all_lots([all_lots[0]['project']])
         self.assertGreater(len(all_lots_for_project), 0)
-        self.assertEquals(all_lots_for_project[0]['project'], all_lots[0]['project'])
+        self.assertEqual(all_lots_for_project[0]['project'], all_lots[0]['project'])
 
         # Should return 0 lots
         all_lots_for_project = self.client.get_all_lots(['FAKEPROJECT'])
@@ -2222,8 +2423,7 @@ class TestAcasclient(BaseAcasClientTest):
             self.assertIsNotNone(salt.get('id'))
         
         # Setup SDF registration with a file containing wrong-case lookups for above values
-        upload_file_file = Path(__file__).resolve().parent.\
-            joinpath('test_acasclient', 'test_045_register_sdf_case_insensitive.sdf')
+        upload_file_file = TEST_DATA_DIR.joinpath('test_045_register_sdf_case_insensitive.sdf')
         mappings = [
             {
                 "dbProperty": "Lot Vendor",
@@ -2441,8 +2641,7 @@ class TestAcasclient(BaseAcasClientTest):
         """
         Tests to Make Sure Salt Can Only Be Derived from Structure or SDF Properties; NOT BOTH! 
         """
-        test_047_load_sdf_with_salts_file = Path(__file__).resolve().parent.\
-            joinpath('test_acasclient', 'test_047_register_sdf_with_salts.sdf')
+        test_047_load_sdf_with_salts_file = TEST_DATA_DIR.joinpath('test_047_register_sdf_with_salts.sdf')
         mappings = [
             {
                 "dbProperty": "Parent Corp Name",
@@ -2508,10 +2707,8 @@ class TestAcasclient(BaseAcasClientTest):
         """
         Test for Warning When Uploading A "New" Compound That Has Existing Parent and Gets New ID
         """
-        test_048_warn_existing_compound_new_id_file_one = Path(__file__).resolve().parent.\
-            joinpath('test_acasclient', 'test_048_warn_existing_compound_new_id.sdf')
-        test_048_warn_existing_compound_new_id_file_two = Path(__file__).resolve().parent.\
-            joinpath('test_acasclient', 'test_048_warn_existing_compound_new_id_two.sdf')
+        test_048_warn_existing_compound_new_id_file_one = TEST_DATA_DIR.joinpath('test_048_warn_existing_compound_new_id.sdf')
+        test_048_warn_existing_compound_new_id_file_two = TEST_DATA_DIR.joinpath('test_048_warn_existing_compound_new_id_two.sdf')
         mappings = [
             {
                 "dbProperty": "Parent Corp Name",
@@ -2589,15 +2786,13 @@ class TestAcasclient(BaseAcasClientTest):
     @requires_absent_basic_cmpd_reg_load
     def skip_049_register_large_sdf_with_error(self):
         # Large request to test performance and error handling
-        file = Path(__file__).resolve().parent\
-            .joinpath('test_acasclient', 'nci1000.sdf')
+        file = TEST_DATA_DIR.joinpath('nci1000.sdf')
         try:
             # SDF load of 1000 structures should take less than 60 seconds
             # to complete. On my machine it takes 30 seconds.
             # This is a performance check to make sure the
             # bulk load hasn't slowed significantly.
-            with Timeout(seconds=90):
-                response = self.basic_cmpd_reg_load(file = file)
+            response = run_with_timeout(90, self.basic_cmpd_reg_load, file = file)
         except TimeoutError:
             self.fail("Timeout error")
 
@@ -2626,8 +2821,7 @@ class TestAcasclient(BaseAcasClientTest):
     @requires_absent_basic_cmpd_reg_load
     def test_051_bulk_load_update_parent_alias(self):
         """Test Proper Updating of Aliases w/ Bulk Loader"""
-        test_051_upload_file_file = Path(__file__).resolve().parent\
-            .joinpath('test_acasclient', 'test_051_register_parent_aliases.sdf')
+        test_051_upload_file_file = TEST_DATA_DIR.joinpath('test_051_register_parent_aliases.sdf')
         files = self.client.upload_files([test_051_upload_file_file])
         request = {
             "fileName": files['files'][0]["name"],
@@ -2797,15 +2991,13 @@ class TestAcasclient(BaseAcasClientTest):
         # Get aliases
         aliases = self.client.get_parent_aliases(corp_name)
         self.assertEqual(len(aliases), 3)
-        aliases = str(aliases)
         self.assertIn(alias_one, aliases)
         self.assertIn(alias_two, aliases)
         self.assertIn(alias_three, aliases) 
 
         # Redo the same file (copy) to see if the result is the same 
         # and aliases aren't just being appended without comparison 
-        test_051_upload_file_file_one_copy = Path(__file__).resolve().parent\
-            .joinpath('test_acasclient', 'test_051_register_parent_aliases_copy.sdf')
+        test_051_upload_file_file_one_copy = TEST_DATA_DIR.joinpath('test_051_register_parent_aliases_copy.sdf')
         files = self.client.upload_files([test_051_upload_file_file_one_copy])
         request["fileName"] = files['files'][0]["name"]
         response = self.client.register_sdf_request(request)
@@ -2815,14 +3007,12 @@ class TestAcasclient(BaseAcasClientTest):
 
         aliases = self.client.get_parent_aliases(corp_name)
         self.assertEqual(len(aliases), 3)
-        aliases = str(aliases)
         self.assertIn(alias_one, aliases)
         self.assertIn(alias_two, aliases)
         self.assertIn(alias_three, aliases) 
 
         # Upload Same File But w/ Different Aliases
-        test_051_upload_file_file_two = Path(__file__).resolve().parent\
-            .joinpath('test_acasclient', 'test_051_register_parent_aliases_diff_aliases.sdf')
+        test_051_upload_file_file_two = TEST_DATA_DIR.joinpath('test_051_register_parent_aliases_diff_aliases.sdf')
         files = self.client.upload_files([test_051_upload_file_file_two])
         request["fileName"] = files['files'][0]["name"]
         response = self.client.register_sdf_request(request)
@@ -2832,17 +3022,10 @@ class TestAcasclient(BaseAcasClientTest):
 
         # Check All Aliases Are Present 
         aliases = self.client.get_parent_aliases(corp_name)
-        self.assertEqual(len(aliases), 5)
-        aliases = str(aliases)
-        self.assertIn(alias_one, aliases)
-        self.assertIn(alias_two, aliases)
-        self.assertIn(alias_three, aliases) 
-        self.assertIn(alias_four, aliases) 
-        self.assertIn(alias_five, aliases) 
+        self.assertCountEqual(aliases, [alias_one, alias_two, alias_three, alias_four, alias_five])
 
         # Upload Same File But w/ Overlap In Aliases 
-        test_051_upload_file_file_three = Path(__file__).resolve().parent\
-            .joinpath('test_acasclient', 'test_051_register_parent_aliases_overlap_aliases.sdf')
+        test_051_upload_file_file_three = TEST_DATA_DIR.joinpath('test_051_register_parent_aliases_overlap_aliases.sdf')
         files = self.client.upload_files([test_051_upload_file_file_three])
         request["fileName"] = files['files'][0]["name"]
         response = self.client.register_sdf_request(request)
@@ -2852,15 +3035,7 @@ class TestAcasclient(BaseAcasClientTest):
 
         # Check All Aliases Are Present (Including Overlap and New Ones)
         aliases = self.client.get_parent_aliases(corp_name)
-        self.assertEqual(len(aliases), 7)
-        aliases = str(aliases)
-        self.assertIn(alias_one, aliases)
-        self.assertIn(alias_two, aliases)
-        self.assertIn(alias_three, aliases) 
-        self.assertIn(alias_four, aliases) 
-        self.assertIn(alias_five, aliases) 
-        self.assertIn(alias_six, aliases) 
-        self.assertIn(alias_seven, aliases) 
+        self.assertCountEqual(aliases, [alias_one, alias_two, alias_three, alias_four, alias_five, alias_six, alias_seven])
 
     @requires_absent_basic_cmpd_reg_load
     @requires_basic_cmpd_reg_load
@@ -2896,8 +3071,7 @@ class TestAcasclient(BaseAcasClientTest):
     def test_054_get_lot_corp_names_by_bulk_load_file(self):
         """Test get lot corp names by bulk load file."""
 
-        files = self.client.\
-            get_cmpdreg_bulk_load_files()
+        files = self.get_cached_cmpdreg_bulk_load_files()
         lot_corp_names = self.client.\
             get_lot_corp_names_by_bulk_load_file(files[0]["id"])
         
@@ -2909,14 +3083,16 @@ class TestAcasclient(BaseAcasClientTest):
     def test_055_get_sdf_by_bulk_load_file(self):
         """Test get sdf by bulk load file."""
 
-        files = self.client.\
-            get_cmpdreg_bulk_load_files()
+        files = self.get_cached_cmpdreg_bulk_load_files()
         sdf_string = self.client.\
             get_sdf_by_bulk_load_file(files[0]["id"])
         
-        self.assertIn('<Parent Stereo Category>', sdf_string)
-        self.assertIn('CMPD-0000001-001', sdf_string)
-        self.assertIn('$$$$', sdf_string)
+        # Find all expected substrings in a single pass over the sdf
+        expected = ('<Parent Stereo Category>', 'CMPD-0000001-001', '$$$$')
+        pattern = re.compile('|'.join(map(re.escape, expected)))
+        found = set(pattern.findall(sdf_string))
+        for needle in expected:
+            self.assertIn(needle, found)
 
     @requires_basic_cmpd_reg_load
     def test_056_additional_assay_scientists(self):
@@ -2984,61 +3160,76 @@ class TestAcasclient(BaseAcasClientTest):
 def get_basic_experiment_load_file(tempdir, project_code=None, corp_name=None, file_name=None, scientist=None, protocol_name=None, experiment_name=None):
     if file_name is None:
         file_name = 'uniform-commas-with-quoted-text.csv'
-    data_file_to_upload = Path(__file__).resolve()\
-                        .parent.joinpath('test_acasclient', file_name)
-    # Read the data file and replace the project code with the one we want
-    with open(data_file_to_upload, 'r') as f:
-        data_file_contents = f.read()
+    data_file_to_upload = TEST_DATA_DIR.joinpath(file_name)
+    # Read the data file as bytes and replace the project code with the one we want
+    data_file_contents = data_file_to_upload.read_bytes()
 
     # Replace the project code
     if project_code is not None:
-        data_file_contents = data_file_contents.replace('Global', project_code)
+        data_file_contents = data_file_contents.replace(b'Global', project_code.encode('utf-8'))
 
     # If corp name is specified, replace the corp name
     if corp_name is not None:
-        data_file_contents = data_file_contents.replace('CMPD-0000001-001', corp_name)
+        data_file_contents = data_file_contents.replace(b'CMPD-0000001-001', corp_name.encode('utf-8'))
 
     # If scientist is specified, replace the scientist
     if scientist is not None:
-        data_file_contents = data_file_contents.replace('bob', scientist)
+        data_file_contents = data_file_contents.replace(b'bob', scientist.encode('utf-8'))
     
     # If protocol name is specified, replace the protocol name
     if protocol_name is not None:
-        data_file_contents = data_file_contents.replace(BASIC_EXPERIMENT_LOAD_PROTOCOL_NAME, protocol_name)
+        data_file_contents = data_file_contents.replace(BASIC_EXPERIMENT_LOAD_PROTOCOL_NAME.encode('utf-8'), protocol_name.encode('utf-8'))
     
     # If experiment name is specified, replace the experiment name
     if experiment_name is not None:
-        data_file_contents = data_file_contents.replace(BASIC_EXPERIMENT_LOAD_EXPERIMENT_NAME, experiment_name)
+        data_file_contents = data_file_contents.replace(BASIC_EXPERIMENT_LOAD_EXPERIMENT_NAME.encode('utf-8'), experiment_name.encode('utf-8'))
 
     # Write the data file to the temp dir
     file_name = f'basic-experiment-{ str(uuid.uuid4())}.csv'
     data_file_to_upload = Path(tempdir).joinpath(file_name)
-    with open(data_file_to_upload, 'w') as f:
+    with open(data_file_to_upload, 'wb') as f:
         f.write(data_file_contents)
 
     return data_file_to_upload
 
+# Tab delimited content of each converted csv file, the test data files don't change during a run
+_csv_to_txt_cache = {}
+
 def csv_to_txt(data_file_to_upload, dir):
     # Get the file name but change it to .txt
     file_name = data_file_to_upload.name
     file_name = file_name.replace(".csv", ".txt")
     file_path = Path(dir, file_name)
-    # Change the delim to the new delim
-    with open(data_file_to_upload, 'r') as f:
-        with open(file_path, 'w') as f2:
-            for line in f:
-                f2.write(line.replace(',', "\t"))
+    # Change the delim to the new delim, converting each csv file only once
+    if data_file_to_upload not in _csv_to_txt_cache:
+        _csv_to_txt_cache[data_file_to_upload] = data_file_to_upload.read_text().replace(',', "\t")
+    # Each test has its own tempdir so the converted content is written out for every call
+    file_path.write_text(_csv_to_txt_cache[data_file_to_upload])
     return file_path
 
 class TestCmpdReg(BaseAcasClientTest):
         
+    # The parent alias kinds are static server configuration so they are only fetched once
+    _parent_alias_type_kind_cache = {}
+
     def get_first_parent_alias_type_kind(self):
         """Get the first alias type kind from a lot."""
-        parent_alias_kinds = self.client.get_parent_alias_kinds()
-        self.assertGreater(len(parent_alias_kinds), 0)
-        alias_type = parent_alias_kinds[0]["kindName"]
-        alias_kind = parent_alias_kinds[0]["lsType"]['typeName']
-        return alias_type, alias_kind
+        if 'type_kind' not in self._parent_alias_type_kind_cache:
+            parent_alias_kinds = self.client.get_parent_alias_kinds()
+            self.assertGreater(len(parent_alias_kinds), 0)
+            alias_type = parent_alias_kinds[0]["kindName"]
+            alias_kind = parent_alias_kinds[0]["lsType"]['typeName']
+            self._parent_alias_type_kind_cache['type_kind'] = (alias_type, alias_kind)
+        return self._parent_alias_type_kind_cache['type_kind']
+
+    # Stereo categories by code, fetched once the first time a test needs them
+    _stereo_category_cache = {}
+
+    def get_stereo_category_dict(self):
+        """Get the stereo categories keyed by code."""
+        if not self._stereo_category_cache:
+            self._stereo_category_cache.update({x['code']: x for x in self.client.get_stereo_categories()})
+        return self._stereo_category_cache
 
     @requires_node_api
     @requires_basic_cmpd_reg_load
@@ -3053,16 +3244,16 @@ class TestCmpdReg(BaseAcasClientTest):
 
         # Create a restricted project 
         project = self.create_basic_project_with_roles()
+        project_name = project.names[PROJECT_NAME]
 
         # Bulk load a compound to the restricted project
         self.basic_cmpd_reg_load(project.code_name)
         all_lots = self.client.get_all_lots()
 
-        # Sort lots by id and get the latest corp id
+        # Get the latest and earliest corp ids by lot id
         # This is because we dont' get the corp id in the response from the bulkload
-        all_lots = sorted(all_lots, key=lambda lot: lot['id'])
-        restricted_project_lot_corp_name = all_lots[-1]['lotCorpName']
-        global_project_lot_corp_name = all_lots[0]['lotCorpName']
+        restricted_project_lot_corp_name = max(all_lots, key=lambda lot: lot['id'])['lotCorpName']
+        global_project_lot_corp_name = min(all_lots, key=lambda lot: lot['id'])['lotCorpName']
 
         # Verify our cmpdreg admin user can fetch the restricted lot
         meta_lot = self.client.\
@@ -3084,10 +3275,10 @@ class TestCmpdReg(BaseAcasClientTest):
         with self.assertRaises(requests.HTTPError) as context:
             meta_lot = user_client.\
                 get_meta_lot(restricted_project_lot_corp_name)
-        self.assertIn('403 Client Error: Forbidden for url', str(context.exception))
+        self.assertEqual(context.exception.response.status_code, 403)
         
         # Now create a user which has access to the project
-        user_client = self.create_and_connect_backdoor_user(acas_user=False, acas_admin=False, creg_user=True, creg_admin=False, project_names = [project.names[PROJECT_NAME]])
+        user_client = self.create_and_connect_backdoor_user(acas_user=False, acas_admin=False, creg_user=True, creg_admin=False, project_names = [project_name])
 
         # User SHOULD be able to fetch the restricted lot
         try:
@@ -3143,26 +3334,27 @@ class TestCmpdReg(BaseAcasClientTest):
 
         # Setup for further tests
         # Create a restricted project 
-        project = self.create_basic_project_with_roles()
+        project = self.get_shared_restricted_project()
+        project_name = project.names[PROJECT_NAME]
 
         # Bulk load a compound to the restricted project
         self.basic_cmpd_reg_load(project.code_name)
         all_lots = self.client.get_all_lots()
 
         # Load an experiment to the newly created restricted project using the global project lots
-        file_to_upload = get_basic_experiment_load_file(self.tempdir, project.names[PROJECT_NAME])
+        file_to_upload = get_basic_experiment_load_file(self.tempdir, project_name)
         response = self.client.\
             experiment_loader(file_to_upload, "bob", False)
         restricted_experiment_code_name = response['results']['experimentCode']
 
-        # Sort lots by id and get the latest corp id
+        # Get the earliest lot by id
         # This is because we dont' get the corp id in the response from the bulkload
-        all_lots = sorted(all_lots, key=lambda lot: lot['id'])
-        global_project_lot_corp_name = all_lots[0]['lotCorpName']
-        global_project_parent_corp_name = all_lots[0]['parentCorpName']
+        global_project_lot = min(all_lots, key=lambda lot: lot['id'])
+        global_project_lot_corp_name = global_project_lot['lotCorpName']
+        global_project_parent_corp_name = global_project_lot['parentCorpName']
 
-        # Find the lot that was bulk loaded with the same corp name as the global project
-        restricted_project_lot = [lot for lot in all_lots if lot['parentCorpName'] == global_project_parent_corp_name][-1]
+        # Find the latest lot that was bulk loaded with the same corp name as the global project
+        restricted_project_lot = max((lot for lot in all_lots if lot['parentCorpName'] == global_project_parent_corp_name), key=lambda lot: lot['id'])
 
         # Check that CMPDREG-ADMIN, ACAS-ADMIN can get all depdencies
         # Verify our cmpdreg admin can see the restricted lot in the dependencies as the new lot 
@@ -3222,7 +3414,7 @@ class TestCmpdReg(BaseAcasClientTest):
         self.assertGreater(len(global_lot_dependencies['linkedExperiments']), 0)
         
         # CMPDREG-USER no acas roles but has access to restricted project
-        user_client = self.create_and_connect_backdoor_user(acas_user=False, acas_admin=False, creg_user=True, creg_admin=False, project_names = [project.names[PROJECT_NAME]])
+        user_client = self.create_and_connect_backdoor_user(acas_user=False, acas_admin=False, creg_user=True, creg_admin=False, project_names = [project_name])
 
         # User SHOULD be able to fetch the restricted lot depdencies
         try:
@@ -3245,7 +3437,7 @@ class TestCmpdReg(BaseAcasClientTest):
         self.assertGreater(len(global_lot_dependencies['linkedExperiments']), 0)
         
         # CMPDREG-USER and ACAS-USER with access to restricted project
-        user_client = self.create_and_connect_backdoor_user(acas_user=True, acas_admin=False, creg_user=True, creg_admin=False, project_names = [project.names[PROJECT_NAME]])
+        user_client = self.create_and_connect_backdoor_user(acas_user=True, acas_admin=False, creg_user=True, creg_admin=False, project_names = [project_name])
 
         # User SHOULD be able to fetch the restricted lot depdencies
         try:
@@ -3273,16 +3465,16 @@ class TestCmpdReg(BaseAcasClientTest):
         """Test post meta lot."""
 
         # Create a restricted project 
-        project = self.create_basic_project_with_roles()
+        project = self.get_shared_restricted_project()
+        project_name = project.names[PROJECT_NAME]
     
         # Bulk load some compounds to we don't interfere with CMPD-0000001-001
         self.basic_cmpd_reg_load(project.code_name)
         all_lots = self.client.get_all_lots()
 
-        # Sort lots by id and get the latest corp id
+        # Get the latest corp id by lot id
         # This is because we dont' get the corp id in the response from the bulkload
-        all_lots = sorted(all_lots, key=lambda lot: lot['id'])
-        restricted_project_lot_corp_name = all_lots[-1]['lotCorpName']
+        restricted_project_lot_corp_name = max(all_lots, key=lambda lot: lot['id'])['lotCorpName']
         
         # The default user is 'bob' and bob has cmpdreg admin role
         # The basic cmpdreg load has a lot registered that is unrestricted (Global project)
@@ -3299,7 +3491,7 @@ class TestCmpdReg(BaseAcasClientTest):
         with self.assertRaises(requests.HTTPError) as context:
             response = user_client.\
                 save_meta_lot(meta_lot)
-        self.assertIn('403 Client Error: Forbidden for url', str(context.exception))
+        self.assertEqual(context.exception.response.status_code, 403)
         _meta_lot = self.client.get_meta_lot(restricted_project_lot_corp_name)
         self.assertIsNone(_meta_lot["lot"]["modifiedDate"])  # Lot is not modified
 
@@ -3326,13 +3518,13 @@ class TestCmpdReg(BaseAcasClientTest):
         self.assertEqual(response["metalot"]["lot"]["project"], project.code_name)
 
         # Now create a user which has access to the project
-        user_client = self.create_and_connect_backdoor_user(acas_user=False, acas_admin=False, creg_user=True, creg_admin=False, project_names = [project.names[PROJECT_NAME]])
+        user_client = self.create_and_connect_backdoor_user(acas_user=False, acas_admin=False, creg_user=True, creg_admin=False, project_names = [project_name])
 
         # User should still not be able to save the restricted lot because they aren't the owner of the lot
         with self.assertRaises(requests.HTTPError) as context:
             response = user_client.\
                 save_meta_lot(meta_lot)
-        self.assertIn('403 Client Error: Forbidden for url', str(context.exception))
+        self.assertEqual(context.exception.response.status_code, 403)
 
         # Update the lot and make the user the chemist of the lot so they can fetch the restricted lot
         meta_lot["lot"]["chemist"] = user_client.username
@@ -3354,30 +3546,43 @@ class TestCmpdReg(BaseAcasClientTest):
     @requires_basic_experiment_load
     def test_004_delete_lot(self, experiment):
 
-        # Create a restricted project 
-        project = self.create_basic_project_with_roles()
+        # Get the shared restricted project 
+        project = self.get_shared_restricted_project()
 
-        # Create a bunch of users with various roles and project access
-        cmpdreg_user = self.create_and_connect_backdoor_user(prefix="cmpdreg-user-", acas_user=False, acas_admin=False, creg_user=True, creg_admin=False)
-        cmpdreg_user_with_restricted_project_acls = self.create_and_connect_backdoor_user(prefix="cmpdreg-user-acls-", acas_user=False, acas_admin=False, creg_user=True, creg_admin=False, project_names = [project.names[PROJECT_NAME]])
-        acas_user = self.create_and_connect_backdoor_user(prefix="acas-user-", acas_user=True, acas_admin=False, creg_user=False, creg_admin=False)
-        acas_user_restricted_project_acls = self.create_and_connect_backdoor_user(prefix="acas-user-acls-", acas_user=True, acas_admin=False, creg_user=False, creg_admin=False, project_names = [project.names[PROJECT_NAME]])
-        acas_admin = self.create_and_connect_backdoor_user(prefix="acas-admin-", acas_user=True, acas_admin=True, creg_user=False, creg_admin=False)
-        cmpdreg_admin = self.create_and_connect_backdoor_user(prefix="cmpdreg-admin-", acas_user=False, acas_admin=False, creg_user=True, creg_admin=True)
+        # Get the shared users with various roles and project access
+        users = self.get_shared_role_users()
+        cmpdreg_user = users['cmpdreg_user']
+        cmpdreg_user_with_restricted_project_acls = users['cmpdreg_user_with_restricted_project_acls']
+        acas_user = users['acas_user']
+        acas_user_restricted_project_acls = users['acas_user_restricted_project_acls']
+        acas_admin = users['acas_admin']
+        cmpdreg_admin = users['cmpdreg_admin']
+
+        # Meta lots by corp name, refreshed from each save response and dropped once the lot is deleted
+        meta_lots = {}
 
         def can_delete_lot(self, user_client, lot_corp_name, set_owner_first=True, raise_on_linked_data=False):
             if set_owner_first:
-                meta_lot = self.client.get_meta_lot(lot_corp_name)
-                meta_lot["lot"]["chemist"] = user_client.username
-                self.client.save_meta_lot(meta_lot)
+                meta_lot = meta_lots.get(lot_corp_name)
+                if meta_lot is None:
+                    meta_lot = meta_lots[lot_corp_name] = self.client.get_meta_lot(lot_corp_name)
+                # Only save the lot if the user isn't already the chemist
+                if meta_lot["lot"]["chemist"] != user_client.username:
+                    meta_lot["lot"]["chemist"] = user_client.username
+                    meta_lots[lot_corp_name] = self.client.save_meta_lot(meta_lot)["metalot"]
             try:
                 response = user_client.delete_lot(lot_corp_name, raise_on_linked_data=raise_on_linked_data)
             except requests.HTTPError:
                 return False
+            meta_lots.pop(lot_corp_name, None)
             self.assertIn("success", response)
             self.assertTrue(response['success'])
             return True
 
+        def can_delete_lot_as_users(self, user_clients, lot_corp_name, set_owner_first=True):
+            # Each user has to own the lot while attempting the delete, so the attempts run one after another
+            return {user_client.username: can_delete_lot(self, user_client, lot_corp_name, set_owner_first=set_owner_first) for user_client in user_clients}
+
         # Deny Rule: Not an ACAS user and there is assay data for the lot
         self.assertFalse(can_delete_lot(self, cmpdreg_admin, "CMPD-0000001-001", set_owner_first=True))
 
@@ -3385,11 +3590,9 @@ class TestCmpdReg(BaseAcasClientTest):
         response = self.client.delete_experiment(experiment["codeName"])
 
         ## Deny Rule: Not a Creg admin and disableDeleteMyLots=true by default
-        self.assertFalse(can_delete_lot(self, cmpdreg_user, "CMPD-0000001-001", set_owner_first=True))
-        self.assertFalse(can_delete_lot(self, cmpdreg_user_with_restricted_project_acls, "CMPD-0000001-001", set_owner_first=True))
-        self.assertFalse(can_delete_lot(self, acas_user, "CMPD-0000001-001", set_owner_first=True))
-        self.assertFalse(can_delete_lot(self, acas_user_restricted_project_acls, "CMPD-0000001-001", set_owner_first=True))
-        self.assertFalse(can_delete_lot(self, acas_admin, "CMPD-0000001-001", set_owner_first=True))
+        deny_users = [cmpdreg_user, cmpdreg_user_with_restricted_project_acls, acas_user, acas_user_restricted_project_acls, acas_admin]
+        self.assertEqual(can_delete_lot_as_users(self, deny_users, "CMPD-0000001-001", set_owner_first=True),
+                         {user_client.username: False for user_client in deny_users})
 
         # Allow Rule: Creg admin and no assay data on the lot
         self.assertTrue(can_delete_lot(self, cmpdreg_admin, "CMPD-0000001-001", set_owner_first=False))
@@ -3398,15 +3601,9 @@ class TestCmpdReg(BaseAcasClientTest):
         meta_lot = self.client.get_meta_lot("CMPD-0000001-001")
         self.assertIsNone(meta_lot)
 
-        # Create a restricted lot
-        restricted_lot_corp_name = self.create_restricted_lot(project.code_name)
-
-        # Load an experiment to the newly created restricted project using the restricted lot
-        restricted_lot_corp_name = self.create_restricted_lot(project.code_name)
-        file_to_upload = get_basic_experiment_load_file(self.tempdir, project.names[PROJECT_NAME], restricted_lot_corp_name, file_name='4 parameter D-R.csv')
-        response = self.client.\
-            experiment_loader(file_to_upload, "bob", False)
-        self.assertTrue(self.check_lot_exists_in_experiment(restricted_lot_corp_name, response['results']['experimentCode']))
+        # Create a restricted lot and load an experiment to the restricted project using it
+        restricted_lot_corp_name, restricted_experiment_code_name = self.create_restricted_lot_with_experiment(project)
+        self.assertTrue(self.check_lot_exists_in_experiment(restricted_lot_corp_name, restricted_experiment_code_name))
                         
         # Deny rule: Creg admin is not an acas user
         self.assertFalse(can_delete_lot(self, cmpdreg_admin, restricted_lot_corp_name, set_owner_first=True))
@@ -3427,7 +3624,7 @@ class TestCmpdReg(BaseAcasClientTest):
         self.assertIsNone(meta_lot)
 
         # Get the experiment and verify the lot is deleted
-        self.assertFalse(self.check_lot_exists_in_experiment(restricted_lot_corp_name, response['results']['experimentCode']))
+        self.assertFalse(self.check_lot_exists_in_experiment(restricted_lot_corp_name, restricted_experiment_code_name))
 
         # TODO: The following tests are dependent on a non default configuration: client.cmpdreg.metaLot.disableDeleteMyLots = false so we can't test this by default. We should turn this back on when we have a testing system which can change the configurations of acas.
         # # Global compound, with experiment in Global project
@@ -3462,11 +3659,7 @@ class TestCmpdReg(BaseAcasClientTest):
         # self.assertTrue(can_delete_lot(self, cmpdreg_user_with_restricted_project_acls, restricted_lot_corp_name, set_owner_first=True))
 
         # # Load an experiment to the newly created restricted project using the global project lots
-        # restricted_lot_corp_name = self.create_restricted_lot(project.code_name)
-        # file_to_upload = get_basic_experiment_load_file(self.tempdir, project.names[PROJECT_NAME], restricted_lot_corp_name, file_name = '4 parameter D-R.csv')
-        # response = self.client.\
-        #     experiment_loader(file_to_upload, "bob", False)
-        # restricted_experiment_code_name = response['results']['experimentCode']
+        # restricted_lot_corp_name, restricted_experiment_code_name = self.create_restricted_lot_with_experiment(project)
 
         # # Update the lot and make the cmpdreg_user_with_restricted_project_acls the chemist of the lot
         # meta_lot = self.client.get_meta_lot(restricted_lot_corp_name)
@@ -3489,9 +3682,7 @@ class TestCmpdReg(BaseAcasClientTest):
         parents who are duplicates of each other.
         """
 
-        file = Path(__file__).resolve().parent.joinpath(
-            'test_acasclient', 'test_005_swap_parent_structures.sdf')
-        self.basic_cmpd_reg_load(file=file)
+        self.basic_cmpd_reg_load(file=SWAP_PARENT_STRUCTURES_SDF)
 
         # CMPD-0000001 / alias-1 (structure: A, stereo category: Single stereoisomer)
         # CMPD-0000002 / alias-2 (structure: A'(stereoisomer of 1), stereo category: Single stereoisomer)
@@ -3508,16 +3699,16 @@ class TestCmpdReg(BaseAcasClientTest):
 
         def _check_mol_weights(lot_corp_name, expected_parent_mw, expected_lot_mw, expected_mol_formula):
             parent_mw, lot_mw, mol_formula = _get_mol_weights_and_formula(lot_corp_name)
-            self.assertAlmostEqual(parent_mw, expected_parent_mw, places=3)
-            self.assertEqual(mol_formula, expected_mol_formula)
-            self.assertAlmostEqual(lot_mw, expected_lot_mw, places=3)
+            # Compare weights to 3 decimal places alongside the formula in a single assertion
+            self.assertEqual(
+                (round(parent_mw, 3), round(lot_mw, 3), mol_formula),
+                (round(expected_parent_mw, 3), round(expected_lot_mw, 3), expected_mol_formula))
         
-        # Gather original mol weights and mol formulas
-        exp_001_tuple = _get_mol_weights_and_formula('CMPD-0000001-001')
-        exp_002_tuple = _get_mol_weights_and_formula('CMPD-0000002-001')
-        exp_004_tuple = _get_mol_weights_and_formula('CMPD-0000004-001')
-        exp_005_tuple = _get_mol_weights_and_formula('CMPD-0000005-001')
-        exp_006_tuple = _get_mol_weights_and_formula('CMPD-0000006-001')
+        # Gather original mol weights and mol formulas, fetching the independent lots concurrently
+        baseline_lot_corp_names = ['CMPD-0000001-001', 'CMPD-0000002-001', 'CMPD-0000004-001', 'CMPD-0000005-001', 'CMPD-0000006-001']
+        with ThreadPoolExecutor(max_workers=len(baseline_lot_corp_names)) as executor:
+            exp_001_tuple, exp_002_tuple, exp_004_tuple, exp_005_tuple, exp_006_tuple = \
+                executor.map(_get_mol_weights_and_formula, baseline_lot_corp_names)
 
         try:
             # Swapping 1 and 3 will introduce duplicacy between 1 and 2.
@@ -3593,13 +3784,12 @@ class TestCmpdReg(BaseAcasClientTest):
             # self.assertTrue(response["hasError"])
             # self.assertEqual(response["errorMessage"], exp_error_msg)
 
-            # Try making a valid swap as a non-admin and confirm it fails
-            # due to permissions
+            # Valid swap as a non-admin fails due to permissions.
             cmpdreg_user = self.create_and_connect_backdoor_user(acas_user=False, acas_admin=False, creg_user=True, creg_admin=False)
             with self.assertRaises(requests.HTTPError) as context:
                 response = cmpdreg_user.swap_parent_structures(
                     corp_name1='CMPD-0000001', corp_name2='CMPD-0000002')
-            self.assertIn('401 Client Error: Unauthorized for url', str(context.exception))
+            self.assertEqual(context.exception.response.status_code, 401)
         finally:
             # Prevent interaction with other tests.
             self.delete_all_cmpd_reg_bulk_load_files()
@@ -3612,36 +3802,42 @@ class TestCmpdReg(BaseAcasClientTest):
     @requires_basic_experiment_load
     def test_006_reparent_lot(self, experiment):
         # Function with test to verify reparent lot functionality
+        # Keys expected in both dry run and wet run reparent responses
+        REPARENT_RESPONSE_KEYS = frozenset({"newLot", "modifiedBy", "originalLotCorpName", "originalParentCorpName", "originalParentDeleted", "originalLotNumber"})
+
+        # Original meta lots by corp name, which are unchanged until a wet run reparents the lot
+        original_meta_lots = {}
+
+        # New lot corp names predicted by dry runs, by (lot corp name, adopting parent corp name)
+        predicted_lot_corp_names = {}
+
         def can_reparent_lot(self, user_client, lot_corp_name, adopting_parent_corp_name, dry_run):
             try:
-                original_meta_lot = self.client.get_meta_lot(lot_corp_name)
-                dry_run_response = user_client.reparent_lot(lot_corp_name, adopting_parent_corp_name, True)
-                self.assertIn("newLot", dry_run_response)
-                self.assertIn("modifiedBy", dry_run_response)
-                self.assertIn("originalLotCorpName", dry_run_response)
-                self.assertIn("originalParentCorpName", dry_run_response)
-                self.assertIn("originalParentDeleted", dry_run_response)
-                self.assertIn("originalLotNumber", dry_run_response)
-                self.assertEqual(dry_run_response['newLot']["parent"]["corpName"], adopting_parent_corp_name)
-                
-                # Make sure we can still find the original lot corp name if we haven't done a wet run yet
-                meta_lot = self.client.get_meta_lot(lot_corp_name)
-                self.assertEqual(meta_lot["lot"]["parent"]["corpName"], original_meta_lot["lot"]["parent"]["corpName"])
-                self.assertEqual(meta_lot["lot"]["saltForm"]["corpName"], original_meta_lot["lot"]["parent"]["corpName"])
-
-                if not dry_run:
+                if dry_run:
+                    original_meta_lot = original_meta_lots.get(lot_corp_name)
+                    if original_meta_lot is None:
+                        original_meta_lot = original_meta_lots[lot_corp_name] = self.client.get_meta_lot(lot_corp_name)
+                    dry_run_response = user_client.reparent_lot(lot_corp_name, adopting_parent_corp_name, True)
+                    self.assertEqual(set(), REPARENT_RESPONSE_KEYS - dry_run_response.keys())
+                    self.assertEqual(dry_run_response['newLot']["parent"]["corpName"], adopting_parent_corp_name)
+                    predicted_lot_corp_names[(lot_corp_name, adopting_parent_corp_name)] = dry_run_response["newLot"]["corpName"]
+
+                    # Make sure we can still find the original lot corp name if we haven't done a wet run yet
+                    meta_lot = self.client.get_meta_lot(lot_corp_name)
+                    self.assertEqual(meta_lot["lot"]["parent"]["corpName"], original_meta_lot["lot"]["parent"]["corpName"])
+                    self.assertEqual(meta_lot["lot"]["saltForm"]["corpName"], original_meta_lot["lot"]["parent"]["corpName"])
+                else:
                     wet_run_response = user_client.reparent_lot(lot_corp_name, adopting_parent_corp_name, False)
-                    self.assertIn("newLot", wet_run_response)
-                    self.assertIn("modifiedBy", wet_run_response)
-                    self.assertIn("originalLotCorpName", wet_run_response)
-                    self.assertIn("originalParentCorpName", wet_run_response)
-                    self.assertIn("originalParentDeleted", wet_run_response)
-                    self.assertIn("originalLotNumber", wet_run_response)
+                    original_meta_lots.pop(lot_corp_name, None)
+                    self.assertEqual(set(), REPARENT_RESPONSE_KEYS - wet_run_response.keys())
 
                     self.assertEqual(wet_run_response['newLot']["parent"]["corpName"], adopting_parent_corp_name)
 
-                    # Make sure the predicted lot corp name is the same as the actual lot corp name we changed to
-                    self.assertEqual(wet_run_response["newLot"]["corpName"], dry_run_response["newLot"]["corpName"])
+                    # Make sure the lot corp name predicted by an earlier dry run is the same as the actual lot corp name we changed to
+                    # Every allowed wet run follows a dry run, so a missing prediction is a bug in the test
+                    predicted_lot_corp_name = predicted_lot_corp_names.pop((lot_corp_name, adopting_parent_corp_name), None)
+                    self.assertIsNotNone(predicted_lot_corp_name, f"No dry run prediction for reparenting {lot_corp_name} to {adopting_parent_corp_name}")
+                    self.assertEqual(wet_run_response["newLot"]["corpName"], predicted_lot_corp_name)
 
                     # Make sure we canf ind the new lot and that the parent and salt form are same as new corp name
                     meta_lot = self.client.get_meta_lot(wet_run_response["newLot"]["corpName"])
@@ -3653,16 +3849,17 @@ class TestCmpdReg(BaseAcasClientTest):
             
             return True
 
-        # Create a restricted project 
-        project = self.create_basic_project_with_roles()
-        
-        # Create a bunch of users with various roles and project access
-        cmpdreg_user = self.create_and_connect_backdoor_user(acas_user=False, acas_admin=False, creg_user=True, creg_admin=False)
-        cmpdreg_user_with_restricted_project_acls = self.create_and_connect_backdoor_user(acas_user=False, acas_admin=False, creg_user=True, creg_admin=False, project_names = [project.names[PROJECT_NAME]])
-        acas_user = self.create_and_connect_backdoor_user(acas_user=True, acas_admin=False, creg_user=False, creg_admin=False)
-        acas_user_restricted_project_acls = self.create_and_connect_backdoor_user(acas_user=True, acas_admin=False, creg_user=False, creg_admin=False, project_names = [project.names[PROJECT_NAME]])
-        acas_admin = self.create_and_connect_backdoor_user(acas_user=True, acas_admin=True, creg_user=False, creg_admin=False)
-        cmpdreg_admin = self.create_and_connect_backdoor_user(acas_user=False, acas_admin=False, creg_user=True, creg_admin=True)
+        # Get the shared restricted project 
+        project = self.get_shared_restricted_project()
+
+        # Get the shared users with various roles and project access
+        users = self.get_shared_role_users()
+        cmpdreg_user = users['cmpdreg_user']
+        cmpdreg_user_with_restricted_project_acls = users['cmpdreg_user_with_restricted_project_acls']
+        acas_user = users['acas_user']
+        acas_user_restricted_project_acls = users['acas_user_restricted_project_acls']
+        acas_admin = users['acas_admin']
+        cmpdreg_admin = users['cmpdreg_admin']
 
         # Verify dry run works by doing a dry run reparent
         # Starting state is 2 lots (1 on CMPD-0000001 and 1 on CMPD-0000002)
@@ -3675,10 +3872,7 @@ class TestCmpdReg(BaseAcasClientTest):
         # Verify that the assay data has moved to the new lot which should be CMPD-0000002-002 dependencies
         depdencies = self.client.get_lot_dependencies("CMPD-0000002-002")
         self.assertIn("linkedExperiments", depdencies)
-        hasExperiment = False
-        for depExperiment in depdencies["linkedExperiments"]:
-            if depExperiment["code"] == experiment["codeName"]:
-                hasExperiment = True
+        hasExperiment = any(depExperiment["code"] == experiment["codeName"] for depExperiment in depdencies["linkedExperiments"])
         self.assertTrue(hasExperiment)
         
         # Current state is 2 lots (2 on CMPD-0000002 and 0 on CMPD-0000002 (which is now deleted))
@@ -3707,12 +3901,7 @@ class TestCmpdReg(BaseAcasClientTest):
         self.assertEqual(len(all_lots), 4)
         
         # Get a count of lots per parent
-        parents = {}
-        for lot in all_lots:
-            if lot["parentCorpName"] not in parents:
-                parents[lot["parentCorpName"]] = 1
-            else:
-                parents[lot["parentCorpName"]] += 1
+        parents = Counter(lot["parentCorpName"] for lot in all_lots)
 
         # Verify we have 2 lots per parent after the re-arranging we did
         self.assertEqual(parents["CMPD-0000002"], 2)
@@ -3724,9 +3913,7 @@ class TestCmpdReg(BaseAcasClientTest):
         Get, set, and add parent aliases
         """
 
-        file = Path(__file__).resolve().parent.joinpath(
-            'test_acasclient', 'test_005_swap_parent_structures.sdf')
-        self.basic_cmpd_reg_load(file=file)
+        self.basic_cmpd_reg_load(file=SWAP_PARENT_STRUCTURES_SDF)
 
         # Setup constants
         corp_name = "CMPD-0000001"
@@ -3736,7 +3923,7 @@ class TestCmpdReg(BaseAcasClientTest):
         # Get aliases
         aliases = self.client.get_parent_aliases(corp_name)
         self.assertEqual(len(aliases), 1)
-        self.assertEquals(aliases[0], alias_1)
+        self.assertEqual(aliases[0], alias_1)
 
         # Get parent alias kinds
         alias_type, alias_kind = self.get_first_parent_alias_type_kind()
@@ -3750,17 +3937,17 @@ class TestCmpdReg(BaseAcasClientTest):
 
         # Check the metalot and verify that the test_alias with the same type and kind was added
         parent_aliases = meta_lot["lot"]['saltForm']['parent']['parentAliases']
-        has_test_alias = False
-        for parent_alias in parent_aliases:
-            if parent_alias["aliasName"] == test_alias and parent_alias["lsType"] == alias_type and parent_alias["lsKind"] == alias_kind:
-                has_test_alias = True
+        has_test_alias = any(
+            parent_alias["aliasName"] == test_alias and parent_alias["lsType"] == alias_type and parent_alias["lsKind"] == alias_kind
+            for parent_alias in parent_aliases
+        )
         self.assertTrue(has_test_alias)
 
         # Set the aliases to only the test alias
         self.client.set_parent_aliases(corp_name, [test_alias])
         aliases = self.client.get_parent_aliases(corp_name)
         self.assertEqual(len(aliases), 1)
-        self.assertEquals(aliases[0], test_alias)
+        self.assertEqual(aliases[0], test_alias)
     
     @requires_absent_basic_cmpd_reg_load
     def test_008_register_second_lots(self):
@@ -3769,23 +3956,13 @@ class TestCmpdReg(BaseAcasClientTest):
         """
         # Register two lots
         response = self.basic_cmpd_reg_load()
-        self.assertIn('Number of entries processed: 2', response['summary'])
-        self.assertIn('Number of entries with error: 0', response['summary'])
-        self.assertIn('Number of warnings: 0', response['summary'])
-        self.assertIn('New compounds: 2', response['summary'])
-        self.assertIn('New lots of existing compounds: 0', response['summary'])
+        self.assert_summary_counts(response['summary'], processed=2, errors=0, warnings=0, new_compounds=2, new_lots=0)
         
         # Load the same file (but don't map in Lot Number and Lot Corp Name)
-        file = Path(__file__).resolve().parent\
-                .joinpath('test_acasclient', 'test_012_register_sdf.sdf')
+        file = TEST_DATA_DIR.joinpath('test_012_register_sdf.sdf')
 
         mappings = [
-                {
-                    "dbProperty": "Parent Corp Name",
-                    "defaultVal": None,
-                    "required": False,
-                    "sdfProperty": "Parent Corp Name"
-                },
+                PARENT_CORP_NAME_MAPPING,
                 {
                     "dbProperty": "",
                     "defaultVal": None,
@@ -3804,33 +3981,19 @@ class TestCmpdReg(BaseAcasClientTest):
                     "required": True,
                     "sdfProperty": "Lot Scientist"
                 },
-                {
-                    "dbProperty": "Project",
-                    "defaultVal": self.global_project_code,
-                    "required": True,
-                    "sdfProperty": "Project Code Name"
-                },
+                project_mapping(self.global_project_code),
                 {
                     "dbProperty": "Parent Stereo Category",
                     "defaultVal": STEREO_CATEGORY,
                     "required": True,
                     "sdfProperty": "Parent Stereo Category"
                 },
-                {
-                    "dbProperty": "Parent Stereo Comment",
-                    "defaultVal": None,
-                    "required": False,
-                    "sdfProperty": "Parent Stereo Comment"
-                }
+                PARENT_STEREO_COMMENT_MAPPING
             ]
 
         response = self.client.register_sdf(file, "bob",
                                             mappings)
-        self.assertIn('Number of entries processed: 2', response['summary'])
-        self.assertIn('Number of entries with error: 0', response['summary'])
-        self.assertIn('Number of warnings: 0', response['summary'])
-        self.assertIn('New compounds: 0', response['summary'])
-        self.assertIn('New lots of existing compounds: 2', response['summary'])
+        self.assert_summary_counts(response['summary'], processed=2, errors=0, warnings=0, new_compounds=0, new_lots=2)
     
     @requires_absent_basic_cmpd_reg_load
     @requires_node_api
@@ -3840,14 +4003,15 @@ class TestCmpdReg(BaseAcasClientTest):
             # Load compounds
             resp = self.basic_cmpd_reg_load()
             cmpdreg_user = self.create_and_connect_backdoor_user(acas_user=False, acas_admin=False, creg_user=True, creg_admin=False)
-            stereo_cat_dict = {x['code']: x for x in self.client.get_stereo_categories()}
+            stereo_cat_dict = self.get_stereo_category_dict()
             TEST_STEREO_COMMENT = 'test stereo comment'
             TEST_STEREO_CAT_CODE = 'No stereochemistry'
+            # Stereo comment and stereo category code of a parent
+            get_stereo = lambda parent: (parent['stereoComment'], parent['stereoCategory']['code'])
             # Get parent 1
             meta_lot = self.client.get_meta_lot('CMPD-0000001-001')
             parent = meta_lot['lot']['parent']
-            ORIG_STEREO_COMMENT = parent['stereoComment']
-            ORIG_STEREO_CAT_CODE = parent['stereoCategory']['code']
+            ORIG_STEREO_COMMENT, ORIG_STEREO_CAT_CODE = get_stereo(parent)
             # Get parent 2
             meta_lot_2 = self.client.get_meta_lot('CMPD-0000002-001')
             parent_2 = meta_lot_2['lot']['parent']
@@ -3860,22 +4024,21 @@ class TestCmpdReg(BaseAcasClientTest):
             validation_status, validation_resp = self.client.edit_parent(parent, dry_run=True)
             # Confirm validation response mentions the lot
             self.assertTrue(validation_status)
-            self.assertEquals(len(validation_resp), 1)
-            self.assertEquals(validation_resp[0]['code'], 'CMPD-0000001-001')
-            self.assertEquals(validation_resp[0]['name'], 'CMPD-0000001-001')
+            self.assertEqual(len(validation_resp), 1)
+            self.assertEqual(validation_resp[0]['code'], 'CMPD-0000001-001')
+            self.assertEqual(validation_resp[0]['name'], 'CMPD-0000001-001')
             # TODO Get this working reliably and uncomment it
             # Commit the edit
             edit_status, edit_resp = self.client.edit_parent(parent, dry_run=False)
             # Confirm edit response mentions the lot
             self.assertTrue(edit_status)
-            self.assertEquals(len(edit_resp), 1)
-            self.assertEquals(edit_resp[0]['code'], 'CMPD-0000001-001')
-            self.assertEquals(edit_resp[0]['name'], 'CMPD-0000001-001')
+            self.assertEqual(len(edit_resp), 1)
+            self.assertEqual(edit_resp[0]['code'], 'CMPD-0000001-001')
+            self.assertEqual(edit_resp[0]['name'], 'CMPD-0000001-001')
             # Get the parent again and check out changes were made
             meta_lot = self.client.get_meta_lot('CMPD-0000001-001')
             parent = meta_lot['lot']['parent']
-            self.assertEquals(parent['stereoComment'], TEST_STEREO_COMMENT)
-            self.assertEquals(parent['stereoCategory']['code'], TEST_STEREO_CAT_CODE)
+            self.assertEqual(get_stereo(parent), (TEST_STEREO_COMMENT, TEST_STEREO_CAT_CODE))
             # Confirm a non-admin cannot attempt a dry run edit
             # with self.assertRaises(requests.HTTPError) as context:
             #     cmpdreg_user.edit_parent(parent, dry_run=True)
@@ -3894,8 +4057,7 @@ class TestCmpdReg(BaseAcasClientTest):
             # Confirm attributes are back to as they were before
             meta_lot = self.client.get_meta_lot('CMPD-0000001-001')
             parent = meta_lot['lot']['parent']
-            self.assertEquals(parent['stereoComment'], ORIG_STEREO_COMMENT)
-            self.assertEquals(parent['stereoCategory']['code'], ORIG_STEREO_CAT_CODE)
+            self.assertEqual(get_stereo(parent), (ORIG_STEREO_COMMENT, ORIG_STEREO_CAT_CODE))
             # Edit structure to match parent 2
             # This should result in a duplicate, and thus be blocked
             parent['molStructure'] = CMPD_2_STRUCTURE
@@ -3903,15 +4065,15 @@ class TestCmpdReg(BaseAcasClientTest):
             validation_status, validation_resp = self.client.edit_parent(parent, dry_run=True)
             self.assertFalse(validation_status)
             self.assertFalse(validation_resp['parentUnique'])
-            self.assertEquals(len(validation_resp['dupeParents']), 1)
-            self.assertEquals(validation_resp['dupeParents'][0]['corpName'], 'CMPD-0000002')
+            self.assertEqual(len(validation_resp['dupeParents']), 1)
+            self.assertEqual(validation_resp['dupeParents'][0]['corpName'], 'CMPD-0000002')
             # Attempt non-dryrun (should fail)
             edit_status, edit_resp = self.client.edit_parent(parent, dry_run=False)
             self.assertFalse(edit_status)
             self.assertFalse(edit_status)
             self.assertFalse(edit_resp['parentUnique'])
-            self.assertEquals(len(edit_resp['dupeParents']), 1)
-            self.assertEquals(edit_resp['dupeParents'][0]['corpName'], 'CMPD-0000002')
+            self.assertEqual(len(edit_resp['dupeParents']), 1)
+            self.assertEqual(edit_resp['dupeParents'][0]['corpName'], 'CMPD-0000002')
         finally:
             # Prevent interaction with other tests.
             self.delete_all_cmpd_reg_bulk_load_files()
@@ -3920,47 +4082,16 @@ class TestCmpdReg(BaseAcasClientTest):
     def test_010_validate_sdf_with_empty_aliases(self):
         # Test loading a file that has some blank parent aliases
         # Confirm they don't create empty-string aliases
-        file = Path(__file__).resolve().parent.joinpath(
-            'test_acasclient', 'text_010_partial_parent_aliases.sdf')
+        file = TEST_DATA_DIR.joinpath('text_010_partial_parent_aliases.sdf')
         project_code = self.global_project_code
 
         mappings = [
-                {
-                    "dbProperty": "Parent Corp Name",
-                    "defaultVal": None,
-                    "required": False,
-                    "sdfProperty": "Parent Corp Name"
-                },
-                {
-                    "dbProperty": "Lot Corp Name",
-                    "defaultVal": None,
-                    "required": False,
-                    "sdfProperty": "Lot Corp Name"
-                },
-                {
-                    "dbProperty": "Lot Chemist",
-                    "defaultVal": "bob",
-                    "required": True,
-                    "sdfProperty": None
-                },
-                {
-                    "dbProperty": "Project",
-                    "defaultVal": project_code,
-                    "required": True,
-                    "sdfProperty": "Project Code Name"
-                },
-                {
-                    "dbProperty": "Parent Stereo Category",
-                    "defaultVal": STEREO_CATEGORY,
-                    "required": True,
-                    "sdfProperty": None
-                },
-                {
-                    "dbProperty": "Parent Alias",
-                    "defaultVal": None,
-                    "required": False,
-                    "sdfProperty": "Parent Alias"
-                }
+                PARENT_CORP_NAME_MAPPING,
+                LOT_CORP_NAME_MAPPING,
+                LOT_CHEMIST_MAPPING,
+                project_mapping(project_code),
+                PARENT_STEREO_CATEGORY_MAPPING,
+                PARENT_ALIAS_MAPPING
             ]
         # Confirm this dryruns successfully
         response = self.client.register_sdf(file, "bob", mappings, dry_run=True)
@@ -3968,66 +4099,41 @@ class TestCmpdReg(BaseAcasClientTest):
         # Confirm this loads successfully
         response = self.client.register_sdf(file, "bob", mappings, dry_run=False)
         self.assertIn('New compounds: 3', response['summary'])
-        # Check out three parents
+        # Check out three parents, fetching their lots concurrently
+        meta_lot_10, meta_lot_11, meta_lot_12 = self.client.get_meta_lots_by_lot_corp_names(
+            ['CMPD-0000010-001', 'CMPD-0000011-001', 'CMPD-0000012-001'])
         # CMPD-0000010 should have one alias
-        meta_lot = self.client.get_meta_lot('CMPD-0000010-001')
-        parent = meta_lot["lot"]["saltForm"]["parent"]
-        self.assertEquals(1, len(parent['parentAliases']))
+        parent = meta_lot_10["lot"]["saltForm"]["parent"]
+        self.assertEqual(1, len(parent['parentAliases']))
         # CMPD-0000011 and CMPD-0000012 should have zero aliases
-        meta_lot = self.client.get_meta_lot('CMPD-0000011-001')
-        parent = meta_lot["lot"]["saltForm"]["parent"]
-        self.assertEquals(0, len(parent['parentAliases']))
-        meta_lot = self.client.get_meta_lot('CMPD-0000012-001')
-        parent = meta_lot["lot"]["saltForm"]["parent"]
-        self.assertEquals(0, len(parent['parentAliases']))
+        parent = meta_lot_11["lot"]["saltForm"]["parent"]
+        self.assertEqual(0, len(parent['parentAliases']))
+        parent = meta_lot_12["lot"]["saltForm"]["parent"]
+        self.assertEqual(0, len(parent['parentAliases']))
     
     @requires_absent_basic_cmpd_reg_load
     def test_011_max_auto_lot_number(self):
         # Load a file with a high lot number above the max auto lot number
-        file_a = Path(__file__).resolve().parent.joinpath(
-            'test_acasclient', 'ibuprofen_big_lot_number.sdf')
+        file_a = TEST_DATA_DIR.joinpath('ibuprofen_big_lot_number.sdf')
         project_code = self.global_project_code
         mappings = [
-                {
-                    "dbProperty": "Lot Number",
-                    "defaultVal": None,
-                    "required": False,
-                    "sdfProperty": "Lot Number"
-                },
-                {
-                    "dbProperty": "Lot Chemist",
-                    "defaultVal": "bob",
-                    "required": True,
-                    "sdfProperty": None
-                },
-                {
-                    "dbProperty": "Project",
-                    "defaultVal": project_code,
-                    "required": True,
-                    "sdfProperty": "Project Code Name"
-                },
-                {
-                    "dbProperty": "Parent Stereo Category",
-                    "defaultVal": STEREO_CATEGORY,
-                    "required": True,
-                    "sdfProperty": None
-                }
+                LOT_NUMBER_MAPPING,
+                LOT_CHEMIST_MAPPING,
+                project_mapping(project_code),
+                PARENT_STEREO_CATEGORY_MAPPING
             ]
         response = self.client.register_sdf(file_a, "bob", mappings, dry_run=False)
         self.assertIn('New compounds: 1', response['summary'])
         # Confirm it got lot 4000, and extract the parent number
-        registered = read_registered_csv(response)
-        lot_4000_corp_name = registered[0]['Corp Name in DB']
+        lot_4000_corp_name = read_registered_corp_names(response)[0]
         self.assertIn('-4000', lot_4000_corp_name)
         parent_a_corp_name = lot_4000_corp_name.replace('-4000', '')
 
         # Register a second parent with different structure
-        file_b = Path(__file__).resolve().parent.joinpath(
-            'test_acasclient', 'ibuprofen_methyl_ester.sdf')
+        file_b = TEST_DATA_DIR.joinpath('ibuprofen_methyl_ester.sdf')
         response = self.client.register_sdf(file_b, "bob", mappings[1:], dry_run=False)
-        registered = read_registered_csv(response)
         # Confirm it gets lot 1
-        lot_b_corp_name = registered[0]['Corp Name in DB']
+        lot_b_corp_name = read_registered_corp_names(response)[0]
         print(f"lot_b_corp_name: {lot_b_corp_name}")
         self.assertIn('-001', lot_b_corp_name)
 
@@ -4043,8 +4149,7 @@ class TestCmpdReg(BaseAcasClientTest):
         # Where the destination parent has both a large lot number and a small lot number
         # Load structure A with no lot number set
         response = self.client.register_sdf(file_a, "bob", mappings[1:], dry_run=False)
-        registered = read_registered_csv(response)
-        lot_a1_corp_name  = registered[0]['Corp Name in DB']
+        lot_a1_corp_name = read_registered_corp_names(response)[0]
         # Confirm it gets lot 1
         # This also tests maxAutoLotNumber with bulk loader
         self.assertIn('-001', lot_a1_corp_name)
@@ -4060,13 +4165,8 @@ class TestCmpdReg(BaseAcasClientTest):
     @requires_basic_cmpd_reg_load
     def test_011_upload_cmpdreg_files(self):
         """Test post meta lot."""
-        # Get all lots
-        all_lots = self.client.get_all_lots()
-
-        # Sort lots by id and get the latest corp id
-        # This is because we dont' get the corp id in the response from the bulkload
-        all_lots = sorted(all_lots, key=lambda lot: lot['id'])
-        lot_corp_name = all_lots[-1]['lotCorpName']
+        # Get the latest lot corp name
+        lot_corp_name = self.get_latest_lot_corp_name()
         
         # The default user is 'bob' and bob has cmpdreg admin role
         # The basic cmpdreg load has a lot registered that is unrestricted (Global project)
@@ -4075,11 +4175,9 @@ class TestCmpdReg(BaseAcasClientTest):
 
         # File to save
         file_name1 = 'dummy.pdf'
-        file_test_path1 = Path(__file__).resolve().parent\
-            .joinpath('test_acasclient', file_name1)
+        file_test_path1 = TEST_DATA_DIR.joinpath(file_name1)
         file_name2 = 'dummy2.PDF' # Upper case on purpose to verify we can handle uppercase extensions
-        file_test_path2 = Path(__file__).resolve().parent\
-            .joinpath('test_acasclient', file_name2)
+        file_test_path2 = TEST_DATA_DIR.joinpath(file_name2)
         # Save the file
         file_type1 = "HPLC"
         file_type2 = "LCMS"
@@ -4131,20 +4229,16 @@ class TestCmpdReg(BaseAcasClientTest):
     def test_012_upload_lot_files(self):
         """ Test saving file to lot"""
 
-        all_lots = self.client.get_all_lots()
-        all_lots = sorted(all_lots, key=lambda lot: lot['id'])
-        lot_corp_name1 = all_lots[-1]['lotCorpName']
+        lot_corp_name1 = self.get_latest_lot_corp_name()
 
         # Create files to upload
         file_name1 = 'dummy.pdf'
-        file_test_path1 = Path(__file__).resolve().parent\
-            .joinpath('test_acasclient', file_name1)
+        file_test_path1 = TEST_DATA_DIR.joinpath(file_name1)
         file_type1 = "HPLC"
         writeup1="My writeup on the file1"
 
         file_name2 = 'dummy2.PDF'
-        file_test_path2 = Path(__file__).resolve().parent\
-            .joinpath('test_acasclient', file_name2)
+        file_test_path2 = TEST_DATA_DIR.joinpath(file_name2)
         file_type2 = "LCMS"
         writeup2="My writeup on the file2"
 
@@ -4155,12 +4249,7 @@ class TestCmpdReg(BaseAcasClientTest):
         self.assertIn("fileList", meta_lot_save_response["metalot"])
         
         # Verify that the fileList has the file we just uploaded by checking the name
-        has_file = False
-        for file in meta_lot_save_response["metalot"]["fileList"]:
-            if file["name"] == file_name1:
-                has_file = True
-                break
-        self.assertTrue(has_file)
+        self.assertIn(file_name1, {file["name"] for file in meta_lot_save_response["metalot"]["fileList"]})
 
         # Test multiple upload
         files = [
@@ -4183,125 +4272,74 @@ class TestCmpdReg(BaseAcasClientTest):
         # Fill the content of the files
         saved_files = self.client._get_cmpdreg_files_content(meta_lot_save_response["metalot"]["fileList"])
 
+        # Hash each local file once so every saved copy is compared digest to digest
+        expected_digests = {file_name: hashlib.sha256(file_path.read_bytes()).digest()
+                            for file_name, file_path in ((file_name1, file_test_path1), (file_name2, file_test_path2))}
+
         # Verify that the fileList has the files we just uploaded by checking the names
-        has_file1 = False
-        has_file2 = False
+        self.assertLessEqual(set(expected_digests), {file["name"] for file in saved_files})
         for file in saved_files:
-            if file["name"] == file_name1:
-                has_file1 = True
-                self.verify_file_and_content_equal(file_test_path1, file['content'])
-            if file["name"] == file_name2:
-                has_file2 = True
-                self.verify_file_and_content_equal(file_test_path2, file['content'])
-                
-        self.assertTrue(has_file1)
-        self.assertTrue(has_file2)
+            if file["name"] in expected_digests:
+                self.assertEqual(hashlib.sha256(file['content']).digest(), expected_digests[file["name"]])
 
     @requires_absent_basic_cmpd_reg_load
     def test_013_unique_parent_alias_tests(self):
         """Test bulk loading multiple lots to an existing parent"""
 
         # Get a file that just has a simple mol structure
-        file = Path(__file__).resolve().parent.joinpath(
-            'test_acasclient', 'test_simple_mol.sdf')
+        file = TEST_DATA_DIR.joinpath('test_simple_mol.sdf')
         
         # Read the mol
         with open(file, 'r') as f:
             simple_mol = f.read()
 
         # Append the > <Parent Alias> to the file content after "M  END"
-        parent_alias_1 = str(uuid.uuid4())
-        stereo_comment_1 = str(uuid.uuid4())
-        parent_1 = simple_mol.replace("M  END", f"M  END\n> <Parent Alias>\n{parent_alias_1}\n")
-        parent_1 = parent_1.replace("M  END", f"M  END\n> <Parent Stereo Comment>\n{stereo_comment_1}\n")
+        parent_alias_1 = secrets.token_hex(8)
+        parent_1 = parent_sdf_record(simple_mol, parent_alias_1)
 
-        # Write the file back out to self.tempdir
-        file = Path(self.tempdir).joinpath('test_multiple_lots.sdf')
-        with open(file, 'w') as f:
-            # Write out the content twice so we can test that we can load multiple lots of the same parent
-            f.write(parent_1)
+        # Build the SDF in memory and upload it straight from the buffer rather than writing it out to self.tempdir
+        sdf = StringIO()
+        sdf.write(parent_1)
+        file = {"name": 'test_multiple_lots.sdf', "data": sdf.getvalue()}
 
         project_code = self.global_project_code
         mappings = [
-                {
-                    "dbProperty": "Parent Corp Name",
-                    "defaultVal": None,
-                    "required": False,
-                    "sdfProperty": "Parent Corp Name"
-                },
-                {
-                    "dbProperty": "Lot Corp Name",
-                    "defaultVal": None,
-                    "required": False,
-                    "sdfProperty": "Lot Corp Name"
-                },
-                {
-                    "dbProperty": "Lot Chemist",
-                    "defaultVal": "bob",
-                    "required": True,
-                    "sdfProperty": None
-                },
-                {
-                    "dbProperty": "Project",
-                    "defaultVal": project_code,
-                    "required": True,
-                    "sdfProperty": "Project Code Name"
-                },
-                {
-                    "dbProperty": "Parent Stereo Category",
-                    "defaultVal": STEREO_CATEGORY,
-                    "required": True,
-                    "sdfProperty": None
-                },
-                {
-                    "dbProperty": "Parent Alias",
-                    "defaultVal": None,
-                    "required": False,
-                    "sdfProperty": "Parent Alias"
-                },
-                {
-                    "dbProperty": "Parent Stereo Comment",
-                    "defaultVal": None,
-                    "required": False,
-                    "sdfProperty": "Parent Stereo Comment"
-                },
+                PARENT_CORP_NAME_MAPPING,
+                LOT_CORP_NAME_MAPPING,
+                LOT_CHEMIST_MAPPING,
+                project_mapping(project_code),
+                PARENT_STEREO_CATEGORY_MAPPING,
+                PARENT_ALIAS_MAPPING,
+                PARENT_STEREO_COMMENT_MAPPING,
             ]
         
         # Load the parent with the alias
         # Confirm this dryruns successfully and loads successfully
         response = self.client.register_sdf(file, "bob", mappings, dry_run=False)
-        self.assertIn("Number of entries processed: 1", response['summary'])
-        self.assertIn("Number of entries with error: 0", response['summary'])
-        self.assertIn('New compounds: 1', response['summary'])
+        self.assert_summary_counts(response['summary'], processed=1, errors=0, new_compounds=1)
 
         # Test 1: Load lots 2, 3 in the same file with the same parent alias and confirm it succeeds
         # Append the content into the file again
         # The file will contain lots 2, 3 of the parent we just loaded
-        with open(file, 'a') as f:
-            f.write(parent_1)
+        sdf.write(parent_1)
+        file = {"name": 'test_multiple_lots.sdf', "data": sdf.getvalue()}
         # Confirm this dryruns successfully
         response = self.client.register_sdf(file, "bob", mappings, dry_run=True)
         # There should not be any errors
-        self.assertIn("Number of entries processed: 2", response['summary'])
-        self.assertIn("Number of entries with error: 0", response['summary'])
-        self.assertIn("New lots of existing compounds: 2", response['summary'])
+        self.assert_summary_counts(response['summary'], processed=2, errors=0, new_lots=2)
         self.assertEqual(0, len(response['results']))
         # Confirm this loads successfully
         response = self.client.register_sdf(file, "bob", mappings, dry_run=False)
-        self.assertIn("Number of entries processed: 2", response['summary'])
-        self.assertIn("Number of entries with error: 0", response['summary'])
-        self.assertIn("New lots of existing compounds: 2", response['summary'])
+        self.assert_summary_counts(response['summary'], processed=2, errors=0, new_lots=2)
         self.assertEqual(0, len(response['results']))
 
         # Test 2: Load a new parent with the same alias as the first parent and confirm it fails
-        stereo_comment_2 = str(uuid.uuid4())
-        parent_2 = simple_mol.replace("M  END", f"M  END\n> <Parent Stereo Comment>\n{stereo_comment_2}\n")
-        parent_2_with_parent_alias_1 = parent_2.replace("M  END", f"M  END\n> <Parent Alias>\n{parent_alias_1}\n")
-        # Write a file with the new parent
-        file = Path(self.tempdir).joinpath('fail_duplicate_blah.sdf')
-        with open(file, 'w') as f:
-            # Write out the content twice so we can test that we can load multiple lots of the same parent
-            f.write(parent_2_with_parent_alias_1)
+        parent_2_with_parent_alias_1 = parent_sdf_record(simple_mol, parent_alias_1)
+        # Write a file with the new parent, reusing the buffer
+        sdf.seek(0)
+        sdf.truncate()
+        sdf.write(parent_2_with_parent_alias_1)
+        file = {"name": 'fail_duplicate_blah.sdf', "data": sdf.getvalue()}
         # Should fail dry run
         response = self.client.register_sdf(file, "bob", mappings, dry_run=True)
         self.assertIn(f"1 entries had: Duplicate parent alias {parent_alias_1}", response['summary'])
@@ -4310,53 +4348,32 @@ class TestCmpdReg(BaseAcasClientTest):
         self.assertIn(f"1 entries had: Duplicate parent alias {parent_alias_1}", response['summary'])
 
         # Test 3: Load 2 new parents with the same alias and confirm it fails
-        parent_alias_3 = str(uuid.uuid4())
-        stereo_comment_3 = str(uuid.uuid4())
-        stereo_comment_4 = str(uuid.uuid4())
-        parent_3 = simple_mol.replace("M  END", f"M  END\n> <Parent Stereo Comment>\n{stereo_comment_3}\n")
-        parent_3 = parent_3.replace("M  END", f"M  END\n> <Parent Alias>\n{parent_alias_3}\n")
-        parent_4 = simple_mol.replace("M  END", f"M  END\n> <Parent Stereo Comment>\n{stereo_comment_4}\n")
-        parent_4_alias_3 = parent_4.replace("M  END", f"M  END\n> <Parent Alias>\n{parent_alias_3}\n")
+        parent_alias_3 = secrets.token_hex(8)
         # Write the file with 2 new parents and same alias
-        file = Path(self.tempdir).joinpath('within_file_same_alias_2_compounds.sdf')
-        with open(file, 'w') as f:
-            f.write(parent_3)
-            f.write(parent_4_alias_3)
+        sdf.seek(0)
+        sdf.truncate()
+        sdf.writelines(parent_sdf_record(simple_mol, parent_alias) for parent_alias in (parent_alias_3, parent_alias_3))
+        file = {"name": 'within_file_same_alias_2_compounds.sdf', "data": sdf.getvalue()}
         # Should fail dry run
         response = self.client.register_sdf(file, "bob", mappings, dry_run=True)
-        self.assertIn("Number of entries processed: 2", response['summary'])
-        self.assertIn("Number of entries with error: 1", response['summary'])
-        self.assertIn(f"1 entries had: Within File, Parent Alias {parent_alias_3} is not unique", response['summary'])
+        self.assert_summary_counts(response['summary'], f"1 entries had: Within File, Parent Alias {parent_alias_3} is not unique", processed=2, errors=1)
         # Should fail load the second lot
         response = self.client.register_sdf(file, "bob", mappings, dry_run=False)
-        self.assertIn("Number of entries processed: 2", response['summary'])
-        self.assertIn("Number of entries with error: 1", response['summary'])
-        self.assertIn(f"1 entries had: Duplicate parent alias {parent_alias_3}", response['summary'])
+        self.assert_summary_counts(response['summary'], f"1 entries had: Duplicate parent alias {parent_alias_3}", processed=2, errors=1)
 
         # Test 4: Load 2 new parents, one with a parent alias that already exists and one new alias
-        stereo_comment_5 = str(uuid.uuid4())
-        parent_alias_6 = str(uuid.uuid4())
-        stereo_comment_6 = str(uuid.uuid4())
-        parent_5 = simple_mol.replace("M  END", f"M  END\n> <Parent Stereo Comment>\n{stereo_comment_5}\n")
-        parent_5_alias_1 = parent_5.replace("M  END", f"M  END\n> <Parent Alias>\n{parent_alias_1}\n")
-        parent_6 = simple_mol.replace("M  END", f"M  END\n> <Parent Stereo Comment>\n{stereo_comment_6}\n")
-        parent_6 = parent_6.replace("M  END", f"M  END\n> <Parent Alias>\n{parent_alias_6}\n")
-        # Write the file with 2 new parents and same alias
-        file = Path(self.tempdir).joinpath('within_file_same_alias_2_compounds.sdf')
-        with open(file, 'w') as f:
-            # Write out the content twice so we can test that we can load multiple lots of the same parent
-            f.write(parent_5_alias_1)
-            f.write(parent_6)
+        parent_alias_6 = secrets.token_hex(8)
+        # Write the file with 2 new parents, the first reusing parent alias 1
+        sdf.seek(0)
+        sdf.truncate()
+        sdf.writelines(parent_sdf_record(simple_mol, parent_alias) for parent_alias in (parent_alias_1, parent_alias_6))
+        file = {"name": 'within_file_same_alias_2_compounds.sdf', "data": sdf.getvalue()}
         # Should fail dry run
         response = self.client.register_sdf(file, "bob", mappings, dry_run=True)
-        self.assertIn("Number of entries processed: 2", response['summary'])
-        self.assertIn("Number of entries with error: 1", response['summary'])
-        self.assertIn(f"1 entries had: Duplicate parent alias {parent_alias_1}", response['summary'])
+        self.assert_summary_counts(response['summary'], f"1 entries had: Duplicate parent alias {parent_alias_1}", processed=2, errors=1)
         # Should fail load one
         response = self.client.register_sdf(file, "bob", mappings, dry_run=False)
-        self.assertIn("Number of entries processed: 2", response['summary'])
-        self.assertIn("Number of entries with error: 1", response['summary'])
-        self.assertIn(f"1 entries had: Duplicate parent alias {parent_alias_1}", response['summary'])
+        self.assert_summary_counts(response['summary'], f"1 entries had: Duplicate parent alias {parent_alias_1}", processed=2, errors=1)
 
 
     @requires_basic_cmpd_reg_load
@@ -4395,6 +4412,16 @@ class TestCmpdReg(BaseAcasClientTest):
 class TestExperimentLoader(BaseAcasClientTest):
     """Tests for `Experiment Loading`."""
     
+    # Load and anonymize the accepted results analysis groups from a file
+    def get_accepted_results_analysis_groups(self, accepted_results_file_path):
+        accepted_results_experiment = json.loads(accepted_results_file_path.read_bytes())
+        return anonymize_experiment_dict(accepted_results_experiment)["analysisGroups"]
+
+    # Dry runs don't write to the server so independent ones can be validated at the same time
+    def dry_run_experiment_load_tests(self, data_files_to_upload, expect_failure=False):
+        with ThreadPoolExecutor(max_workers=len(data_files_to_upload)) as executor:
+            return list(executor.map(lambda data_file_to_upload: self.experiment_load_test(data_file_to_upload, True, expect_failure=expect_failure), data_files_to_upload))
+
     # Test for malformed single quote format file
     def assert_malformed_single_quote_file(self, response):
         self.assertTrue(response['hasError'])
@@ -4407,64 +4434,55 @@ class TestExperimentLoader(BaseAcasClientTest):
 
     # Test to check if expected messages are in messages from experiment loader
     def check_expected_messages(self, expected_messages, messages):
+        # Count the response messages by error level and message once so each expected message is a single lookup
+        message_counts = Counter((m['errorLevel'], m['message']) for m in messages)
         for expected_message in expected_messages:
             # This matches the response error message and level to the expected message and level
-            expected_result = [m for m in messages if m['errorLevel'] == expected_message['errorLevel'] and m['message'] == expected_message['message']]
+            expected_result_count = message_counts[(expected_message['errorLevel'], expected_message['message'])]
             if 'count' in expected_message:
                 if expected_message['count'] > -1:
                     # If count is present and not -1, then we expect the number of results to be equal to the count
-                    self.assertEqual(len(expected_result), expected_message['count'])
+                    self.assertEqual(expected_result_count, expected_message['count'])
                 else:
                     # If count is -1, then we don't care about the number of results, just as long as it has the message
-                    self.assertGreaterThan(len(expected_result), 0)
+                    self.assertGreater(expected_result_count, 0)
             else:
                 # Should return 1 and only 1 match
-                self.assertEqual(len(expected_result), 1)
+                self.assertEqual(expected_result_count, 1)
 
     @requires_basic_cmpd_reg_load
     def test_001_basic_xlsx(self):
         """Test experiment loader xlsx format."""
 
-        data_file_to_upload = Path(__file__).resolve()\
-            .parent.joinpath('test_acasclient', '1_1_Generic.xlsx')
+        data_file_to_upload = TEST_DATA_DIR.joinpath('1_1_Generic.xlsx')
         self.experiment_load_test(data_file_to_upload, True)
         self.experiment_load_test(data_file_to_upload, False)
 
     @requires_basic_cmpd_reg_load
     def test_002_basic_xls(self):
         """Test experiment loader xls format."""
-        data_file_to_upload = Path(__file__).resolve()\
-            .parent.joinpath('test_acasclient', '1_1_Generic.xls')
+        data_file_to_upload = TEST_DATA_DIR.joinpath('1_1_Generic.xls')
         self.experiment_load_test(data_file_to_upload, True)
         self.experiment_load_test(data_file_to_upload, False)
 
     @requires_basic_cmpd_reg_load
     def test_003_basic_xls_1995_fails(self):
         """Test experiment loader 1995 xls format fails."""
-        data_file_to_upload = Path(__file__).resolve()\
-            .parent.joinpath('test_acasclient', '1_1_Generic-XLS_50_1995_Fail.xls')
+        data_file_to_upload = TEST_DATA_DIR.joinpath('1_1_Generic-XLS_50_1995_Fail.xls')
         response = self.experiment_load_test(data_file_to_upload, True, expect_failure=True)
-        expected_messages = [
-            {
-                "errorLevel": "error",
-                "message": "Cannot read input excel file: OldExcelFormatException (Java): The supplied spreadsheet seems to be Excel 5.0/7.0 (BIFF5) format. POI only supports BIFF8 format (from Excel versions 97/2000/XP/2003)"
-            }
-        ]
-        self.check_expected_messages(expected_messages, response['errorMessages'])
+        self.check_expected_messages(EXPECTED_MESSAGES_BASIC_XLS_1995, response['errorMessages'])
 
     @requires_basic_cmpd_reg_load
     def test_004_basic_csv(self):
         """Test experiment loader csv format."""
-        data_file_to_upload = Path(__file__).resolve()\
-            .parent.joinpath('test_acasclient', 'uniform-commas-with-quoted-text.csv')
+        data_file_to_upload = TEST_DATA_DIR.joinpath('uniform-commas-with-quoted-text.csv')
         self.experiment_load_test(data_file_to_upload, True)
         self.experiment_load_test(data_file_to_upload, False)
 
     @requires_basic_cmpd_reg_load
     def test_005_basic_tsv(self):
         """Test experiment loader tsv format."""
-        data_file_to_upload = Path(__file__).resolve()\
-            .parent.joinpath('test_acasclient', 'uniform-commas-with-quoted-text.csv')
+        data_file_to_upload = TEST_DATA_DIR.joinpath('uniform-commas-with-quoted-text.csv')
         txt_file = csv_to_txt(data_file_to_upload, self.tempdir)
         self.experiment_load_test(txt_file, True)
         self.experiment_load_test(txt_file, False)
@@ -4477,8 +4495,7 @@ class TestExperimentLoader(BaseAcasClientTest):
 
         # Reload the experiment
         # It's expected that this file has the same name as that loaded by `requires_basic_cmpd_reg_load` and will delete and reload the experiment getting a new code name
-        data_file_to_upload = Path(__file__).resolve()\
-            .parent.joinpath('test_acasclient', 'uniform-commas-with-quoted-text.csv')
+        data_file_to_upload = TEST_DATA_DIR.joinpath('uniform-commas-with-quoted-text.csv')
         result = self.experiment_load_test(data_file_to_upload, False)
         expected_messages = [
             {
@@ -4502,23 +4519,24 @@ class TestExperimentLoader(BaseAcasClientTest):
 
         # Get new experiment and make sure that the "previous experiment code" value is set in ls states of the new experiment
         new_experiment = self.client.get_experiment_by_code(result['results']['experimentCode'])
-        has_previous_code = False
-        for ls_state in new_experiment['lsStates']:
-            if ls_state['ignored'] == False and ls_state['deleted'] == False and ls_state['lsType'] == "metadata" and ls_state['lsKind'] == "experiment metadata":
-                for ls_value in ls_state['lsValues']:
-                    if ls_value['ignored'] == False and ls_value['deleted'] == False and ls_value['lsType'] == "codeValue" and ls_value['lsKind'] == "previous experiment code" and ls_value['codeValue'] == code_of_previous_experiment:
-                        has_previous_code = True
-                    
+        # Stop at the first matching value
+        has_previous_code = any(
+            ls_value['codeValue'] == code_of_previous_experiment
+            for ls_state in new_experiment['lsStates']
+            if ls_state['ignored'] == False and ls_state['deleted'] == False and ls_state['lsType'] == "metadata" and ls_state['lsKind'] == "experiment metadata"
+            for ls_value in ls_state['lsValues']
+            if ls_value['ignored'] == False and ls_value['deleted'] == False and ls_value['lsType'] == "codeValue" and ls_value['lsKind'] == "previous experiment code"
+        )
         if not has_previous_code:
             self.fail("Could not find previous experiment code in ls states of the reloaded experiment")
 
     @requires_basic_cmpd_reg_load
     def test_007_non_unitform_comma_csv(self):
         # Test for non-uniform comma format file
-        data_file_to_upload = Path(__file__).resolve()\
-            .parent.joinpath('test_acasclient', 'non-uniform-commas-with-quoted-text.csv')
+        data_file_to_upload = TEST_DATA_DIR.joinpath('non-uniform-commas-with-quoted-text.csv')
         self.experiment_load_test(data_file_to_upload, True)
         self.experiment_load_test(data_file_to_upload, False)
+        # Both files load the same experiment, so the tsv dry run validates a reload of the committed csv
         txt_file = csv_to_txt(data_file_to_upload, self.tempdir)
         self.experiment_load_test(txt_file, True)
         self.experiment_load_test(txt_file, False)
@@ -4526,13 +4544,10 @@ class TestExperimentLoader(BaseAcasClientTest):
     @requires_basic_cmpd_reg_load
     def test_008_malformed_single_quote(self):
 
-        data_file_to_upload = Path(__file__).resolve()\
-            .parent.joinpath('test_acasclient', 'malformatted-single-quote.csv')
-        response = self.experiment_load_test(data_file_to_upload, True, expect_failure=True)
-        self.assert_malformed_single_quote_file(response)
+        data_file_to_upload = TEST_DATA_DIR.joinpath('malformatted-single-quote.csv')
         txt_file = csv_to_txt(data_file_to_upload, self.tempdir)
-        response = self.experiment_load_test(txt_file, True, expect_failure=True)
-        self.assert_malformed_single_quote_file(response)
+        for response in self.dry_run_experiment_load_tests([data_file_to_upload, txt_file], expect_failure=True):
+            self.assert_malformed_single_quote_file(response)
 
     @requires_basic_cmpd_reg_load
     def test_009_speed(self):
@@ -4542,18 +4557,15 @@ class TestExperimentLoader(BaseAcasClientTest):
             # less than 25 seconds to complete. On my machine it takes
             # about 9 seconds. This is a sanity check to make sure the
             # dry run hasn't slowed significantly.
-            with Timeout(seconds=25):
-                data_file_to_upload = Path(__file__).resolve()\
-                    .parent.joinpath('test_acasclient', '50k-lines.csv')
-                self.experiment_load_test(data_file_to_upload, True)
+            data_file_to_upload = TEST_DATA_DIR.joinpath('50k-lines.csv')
+            run_with_timeout(25, self.experiment_load_test, data_file_to_upload, True)
         except TimeoutError:
             self.fail("Timeout error")
 
     @requires_basic_cmpd_reg_load
     def test_010_experiment_loader_curve_validation(self):
         # Test dose response curve validation
-        data_file_to_upload = Path(__file__).resolve()\
-            .parent.joinpath('test_acasclient', '4 parameter D-R-validation.csv')
+        data_file_to_upload = TEST_DATA_DIR.joinpath('4 parameter D-R-validation.csv')
 
         response = self.experiment_load_test(data_file_to_upload, True, expect_failure=True)
 
@@ -4563,56 +4575,13 @@ class TestExperimentLoader(BaseAcasClientTest):
 
         # Leaving this comment here on how this dict was generted in case there are expected changes we want to make to the expected results match the current results
         # print(json.dumps(response['errorMessages'], sort_keys=True, indent=4))
-        expected_messages = [
-            {
-                "errorLevel": "error",
-                "message": "No 'Rendering Hint' was found for curve id '9629'. If a curve id is specified, it must be associated with a Rendering Hint."
-            },
-            {
-                "errorLevel": "error",
-                "message": "Could not find `Calculated Results` match for `Raw Results` links: 'g'"
-            },
-            {
-                "errorLevel": "warning",
-                "message": "A date is not in the proper format. Found: \"5/8/15\" This was interpreted as \"2015-08-05\". Please enter dates as YYYY-MM-DD."
-            },
-            {
-                "errorLevel": "warning",
-                "message": "For curve ids: '126915'. The following numeric parameters were not found: Slope, Min, Max, EC50. Please provide numeric values for these parameters so that curves are drawn properly."
-            },
-            {
-                "errorLevel": "warning",
-                "message": "For curve ids: '126933','126934'. The following numeric parameters were not found: Slope, Max. Please provide numeric values for these parameters so that curves are drawn properly."
-            },
-            {
-                "errorLevel": "warning",
-                "message": "For curve ids: '8788'. The following numeric parameters were not found: Slope. Please provide numeric values for these parameters so that curves are drawn properly."
-            },
-            {
-                "errorLevel": "warning",
-                "message": "For curve ids: '8836'. The following numeric parameters were not found: Min. Please provide numeric values for these parameters so that curves are drawn properly."
-            },
-            {
-                "errorLevel": "warning",
-                "message": "For curve ids: '9629'. The following numeric parameters were not found: EC50. Please provide numeric values for these parameters so that curves are drawn properly."
-            },
-            {
-                "errorLevel": "warning",
-                "message": "For curve ids: 'a','b','c'. The R&#178; is < than the threshold value of 0.9."
-            },
-            {
-                "errorLevel": "warning",
-                "message": "For curve ids: 'f','8806'. The following numeric parameters were not found: Max. Please provide numeric values for these parameters so that curves are drawn properly."
-            }
-        ]
         # Pretty json to print messages above if needed for updating tests
         #json.dumps(response['errorMessages'], sort_keys=True, indent=4)
-        self.check_expected_messages(expected_messages, response['errorMessages'])
+        self.check_expected_messages(EXPECTED_MESSAGES_CURVE_VALIDATION, response['errorMessages'])
 
         # Specific tests for when a user uploads a file without any flags in the raw data section
         # See details here: https://github.com/mcneilco/acas/pull/989
-        data_file_to_upload = Path(__file__).resolve()\
-            .parent.joinpath('test_acasclient', '4 parameter D-R-validation-no-flags.csv')
+        data_file_to_upload = TEST_DATA_DIR.joinpath('4 parameter D-R-validation-no-flags.csv')
 
         response = self.experiment_load_test(data_file_to_upload, True)
         self.assertFalse(response['hasError'])
@@ -4621,8 +4590,7 @@ class TestExperimentLoader(BaseAcasClientTest):
     @requires_basic_cmpd_reg_load
     def test_011_dose_response_experiment_loader(self):
         """Test dose response experiment loader."""
-        data_file_to_upload = Path(__file__).resolve()\
-            .parent.joinpath('test_acasclient', '4 parameter D-R.csv')
+        data_file_to_upload = TEST_DATA_DIR.joinpath('4 parameter D-R.csv')
         request = {
             "data_file": data_file_to_upload,
             "user": "bob",
@@ -4664,16 +4632,11 @@ class TestExperimentLoader(BaseAcasClientTest):
         # curve fit parameters (it replaces it with it's own curve fits)
         self.assertTrue(response["experiment_loader_response"]['results']['htmlSummary'].find("bv_doseResponseSummaryTable") == -1)
 
-        # Read the file as a string so that we can update the data
-        with open(data_file_to_upload, 'r') as f:
-            data_file_as_string = f.read()
-
-        # Substitute Format with "Generic" to test for warning for uploading Generic to 
+        # Substitute Format with "Generic" in the raw file bytes to test for warning for uploading Generic to 
         # a Dose Response experiment
-        data_file_as_string = data_file_as_string.replace("Format,Dose Response", "Format,Generic")
         request["data_file"] = {
-            "name": f.name,
-            "data": data_file_as_string
+            "name": data_file_to_upload.name,
+            "data": data_file_to_upload.read_bytes().replace(b"Format,Dose Response", b"Format,Generic")
         }
         response = self.client.\
             dose_response_experiment_loader(**request)
@@ -4686,14 +4649,10 @@ class TestExperimentLoader(BaseAcasClientTest):
         self.assertIn('errorMessages', response["experiment_loader_response"])
         # Assert that error messages has a warning message
         genericFormatUploadedAsDoseResponse = "The upload 'Format' was set to 'Generic' and a 'curve id' column was found. Curve data may not upload correctly."
-        matchingMessage = None
-        for error_message in response["experiment_loader_response"]['errorMessages']:
-            if error_message['errorLevel'] == 'warning':
-                # Check if warning has the message in it
-                if genericFormatUploadedAsDoseResponse in error_message['message']:
-                    matchingMessage = True
-        if matchingMessage is None:
-            self.fail("ACAS did not produce warning that 'Generic' was uploaded as 'Dose")
+        # Stop at the first warning which has the message in it
+        matchingMessage = any(error_message['errorLevel'] == 'warning' and genericFormatUploadedAsDoseResponse in error_message['message']
+                              for error_message in response["experiment_loader_response"]['errorMessages'])
+        self.assertTrue(matchingMessage, "ACAS did not produce warning that 'Generic' was uploaded as 'Dose")
         
         # Use the original data file for further tests
         request["data_file"] = data_file_to_upload
@@ -4718,8 +4677,7 @@ class TestExperimentLoader(BaseAcasClientTest):
         self.assertIsNotNone(experiment)
         self.assertIn("analysisGroups", experiment)
 
-        accepted_results_file_path = Path(__file__).resolve().parent\
-            .joinpath('test_acasclient', "test_dose_response_experiment_loader_accepted_results.json")
+        accepted_results_file_path = TEST_DATA_DIR.joinpath("test_dose_response_experiment_loader_accepted_results.json")
 
         # Leaving this here to show how to update the accepted results file
         # with open(accepted_results_file_path, 'w') as f:
@@ -4727,21 +4685,19 @@ class TestExperimentLoader(BaseAcasClientTest):
 
         experiment = anonymize_experiment_dict(experiment)
         
-        accepted_results_experiment  = json.loads(accepted_results_file_path.read_text())
-        accepted_results_analysis_groups = anonymize_experiment_dict(accepted_results_experiment)["analysisGroups"]
+        accepted_results_analysis_groups = self.get_accepted_results_analysis_groups(accepted_results_file_path)
         new_results_analysis_groups = experiment["analysisGroups"]
 
         # Verify that the analysis groups are the same as the accepted results analysis groups
         # Groups should have been sorted by the "Key" analysis group value uploaded in the dose response file
         
-        for i in range(len(accepted_results_analysis_groups)):
-            self.assertDictEqual(accepted_results_analysis_groups[i], new_results_analysis_groups[i])
+        self.assertEqual(len(accepted_results_analysis_groups), len(new_results_analysis_groups))
+        self.assertEqual(accepted_results_analysis_groups, new_results_analysis_groups)
 
     @requires_basic_cmpd_reg_load
     def test_012_escaped_quotes_xls(self):
         """Test experiment loader with escaped quotes in xls file"""
-        data_file_to_upload = Path(__file__).resolve()\
-            .parent.joinpath('test_acasclient', 'escaped_quotes.xls')
+        data_file_to_upload = TEST_DATA_DIR.joinpath('escaped_quotes.xls')
         self.experiment_load_test(data_file_to_upload, True)
         response = self.experiment_load_test(data_file_to_upload, False)
         # Check the loaded experiment
@@ -4749,13 +4705,12 @@ class TestExperimentLoader(BaseAcasClientTest):
             get_experiment_by_code(response['results']['experimentCode'], full = True)
         self.assertIsNotNone(experiment)
         self.assertIn("analysisGroups", experiment)
-        # Find the clobValue
-        clob_value = None
-        for analysis_group in experiment["analysisGroups"]:
-            for state in analysis_group["lsStates"]:
-                for value in state["lsValues"]:
-                    if value["lsKind"] == "Test JSON":
-                        clob_value = value["clobValue"]
+        # Find the first clobValue
+        clob_value = next((value["clobValue"]
+                           for analysis_group in experiment["analysisGroups"]
+                           for state in analysis_group["lsStates"]
+                           for value in state["lsValues"]
+                           if value["lsKind"] == "Test JSON"), None)
         # Ensure the clob value can be parsed as JSON
         self.assertIsNotNone(clob_value)
         parsed_json = json.loads(clob_value)
@@ -4765,8 +4720,7 @@ class TestExperimentLoader(BaseAcasClientTest):
     def test_013_escaped_quotes_csv(self):
         """Test experiment loader with escaped quotes in csv file
         This is a negative test - the experiment load is expected to fail at present. """
-        data_file_to_upload = Path(__file__).resolve()\
-            .parent.joinpath('test_acasclient', 'escaped_quotes.csv')
+        data_file_to_upload = TEST_DATA_DIR.joinpath('escaped_quotes.csv')
         # Validate the experiment
         self.experiment_load_test(data_file_to_upload, True, expect_failure=False)
         # Load and commit - this is now expected to succeed
@@ -4776,13 +4730,12 @@ class TestExperimentLoader(BaseAcasClientTest):
             get_experiment_by_code(response['results']['experimentCode'], full = True)
         self.assertIsNotNone(experiment)
         self.assertIn("analysisGroups", experiment)
-        # Find the clobValue
-        clob_value = None
-        for analysis_group in experiment["analysisGroups"]:
-            for state in analysis_group["lsStates"]:
-                for value in state["lsValues"]:
-                    if value["lsKind"] == "Test JSON":
-                        clob_value = value["clobValue"]
+        # Find the first clobValue
+        clob_value = next((value["clobValue"]
+                           for analysis_group in experiment["analysisGroups"]
+                           for state in analysis_group["lsStates"]
+                           for value in state["lsValues"]
+                           if value["lsKind"] == "Test JSON"), None)
         # Ensure the clob value can be parsed as JSON
         self.assertIsNotNone(clob_value)
         parsed_json = json.loads(clob_value)
@@ -4792,8 +4745,7 @@ class TestExperimentLoader(BaseAcasClientTest):
     def test_014_only_empty_quotes_in_columns(self):
         """Test experiment loader when reading xlsx files that have an empty columns which is interpreted as "" instead of NA (special character causes ""). See for deails: https://github.com/mcneilco/racas/pull/77"""
 
-        data_file_to_upload = Path(__file__).resolve()\
-            .parent.joinpath('test_acasclient', '1_1_Generic_empty_column.xlsx')
+        data_file_to_upload = TEST_DATA_DIR.joinpath('1_1_Generic_empty_column.xlsx')
         response = self.experiment_load_test(data_file_to_upload, True)
         self.assertFalse(response['hasError'])
 
@@ -4801,23 +4753,15 @@ class TestExperimentLoader(BaseAcasClientTest):
     def test_015_inf_as_numeric_error(self):
         """Test for when Inf and -Inf are loaded as numeric values"""
 
-        data_file_to_upload = Path(__file__).resolve()\
-            .parent.joinpath('test_acasclient', 'infinite-numeric-values.csv')
+        data_file_to_upload = TEST_DATA_DIR.joinpath('infinite-numeric-values.csv')
         response = self.experiment_load_test(data_file_to_upload, True, expect_failure=True)
         self.assertTrue(response['hasError'])
-        expected_messages = [
-            {
-                "errorLevel": "error",
-                "message": "The following values are expected to be numbers but are: 'Inf', '-Inf'. Please represent large number values using operators. For example, > 10000 or < -10000."
-            }
-        ]
-        self.check_expected_messages(expected_messages, response['errorMessages'])
+        self.check_expected_messages(EXPECTED_MESSAGES_INF_AS_NUMERIC, response['errorMessages'])
 
     @requires_basic_cmpd_reg_load
     def test_016_new_line_character_in_string(self):
         # Test for non-uniform comma format file
-        data_file_to_upload = Path(__file__).resolve()\
-            .parent.joinpath('test_acasclient', 'quoted-with-new-line-character-in-string.csv')
+        data_file_to_upload = TEST_DATA_DIR.joinpath('quoted-with-new-line-character-in-string.csv')
         self.experiment_load_test(data_file_to_upload, True)
         response = self.experiment_load_test(data_file_to_upload, False)
 
@@ -4826,40 +4770,34 @@ class TestExperimentLoader(BaseAcasClientTest):
             get_experiment_by_code(response['results']['experimentCode'], full = True)
         self.assertIsNotNone(experiment)
 
-        accepted_results_file_path = Path(__file__).resolve().parent\
-            .joinpath('test_acasclient', "test_new_line_character_in_string_experiment_loader_accepted_results.json")
+        accepted_results_file_path = TEST_DATA_DIR.joinpath("test_new_line_character_in_string_experiment_loader_accepted_results.json")
 
         # Leaving this here to show how to update the accepted results file
         # with open(accepted_results_file_path, 'w') as f:
         #     json.dump(experiment, f, indent=2)
         experiment = anonymize_experiment_dict(experiment)
         
-        accepted_results_experiment  = json.loads(accepted_results_file_path.read_text())
-        accepted_results_analysis_groups = anonymize_experiment_dict(accepted_results_experiment)["analysisGroups"]
+        accepted_results_analysis_groups = self.get_accepted_results_analysis_groups(accepted_results_file_path)
         new_results_analysis_groups = experiment["analysisGroups"]
 
         # Verify that the analysis groups are the same as the accepted results analysis groups
         # Groups should have been sorted by the "Key" analysis group value uploaded in the dose response file
-        for i in range(len(accepted_results_analysis_groups)):
-            self.assertDictEqual(accepted_results_analysis_groups[i], new_results_analysis_groups[i])
+        self.assertEqual(len(accepted_results_analysis_groups), len(new_results_analysis_groups))
+        self.assertEqual(accepted_results_analysis_groups, new_results_analysis_groups)
 
     @requires_basic_cmpd_reg_load
     def test_017_report_file(self):
         """Test experiment loader with report file."""
-        data_file_to_upload = Path(__file__).resolve()\
-            .parent.joinpath('test_acasclient', 'uniform-commas-with-quoted-text.csv')
-        report_file_path = Path(__file__).resolve().parent\
-            .joinpath('test_acasclient', 'dummy.pdf')
+        data_file_to_upload = TEST_DATA_DIR.joinpath('uniform-commas-with-quoted-text.csv')
+        report_file_path = TEST_DATA_DIR.joinpath('dummy.pdf')
         self.experiment_load_test(data_file_to_upload, True, report_file_to_upload=report_file_path)
         self.experiment_load_test(data_file_to_upload, False, report_file_to_upload=report_file_path)
 
     @requires_basic_cmpd_reg_load
     def test_018_image_file(self):
         """Test experiment loader with image file."""
-        data_file_to_upload = Path(__file__).resolve()\
-            .parent.joinpath('test_acasclient', '12_1_MultipleImage.csv')
-        image_file_path = Path(__file__).resolve().parent\
-            .joinpath('test_acasclient', '12_2_MultipleImage.zip')
+        data_file_to_upload = TEST_DATA_DIR.joinpath('12_1_MultipleImage.csv')
+        image_file_path = TEST_DATA_DIR.joinpath('12_2_MultipleImage.zip')
         self.experiment_load_test(data_file_to_upload, False, images_file_to_upload=image_file_path)
 
     @requires_basic_cmpd_reg_load
@@ -4912,13 +4850,6 @@ class TestExperimentLoader(BaseAcasClientTest):
     @requires_basic_cmpd_reg_load
     def test_020_datatype_number_parsing(self):
         """Test experiment loader number parsing."""
-        data_file_to_upload = Path(__file__).resolve()\
-            .parent.joinpath('test_acasclient', 'datatype-number-parsing.csv')
+        data_file_to_upload = TEST_DATA_DIR.joinpath('datatype-number-parsing.csv')
         response = self.experiment_load_test(data_file_to_upload, False, expect_failure=False)
-        expected_messages = [
-            {
-                "errorLevel": "warning",
-                "message": "The following Number values contain numerals but could not be parsed as Number so will be saved as Text: 'Test1.0Test', '1.0Test', 'Test1.0'. To avoid this warning either remove all numerals from the text, or use a correctly formatted Number. For example, 1, 1.2, 1.23e-10, >1, <1"
-            }
-        ]
-        self.check_expected_messages(expected_messages, response['errorMessages'])
+        self.check_expected_messages(EXPECTED_MESSAGES_NUMBER_PARSING, response['errorMessages'])
@@ -3,17 +3,19 @@
 """Tests for `acasclient` package."""
 
 import os
+import filecmp
 from datetime import datetime
 import uuid
 import logging
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 from acasclient.ddict import ACASDDict, ACASLsThingDDict
 from acasclient.lsthing import (BlobValue, CodeValue, FileValue, LsThingValue,
                                 SimpleLsThing, get_lsKind_to_lsvalue, datetime_to_ts, LsThing, ACAS_DDICT)
 from acasclient.validation import ValidationResult, get_validation_response
 from acasclient.protocol import Protocol
-from tests.test_acasclient import BaseAcasClientTest
+from tests.test_acasclient import BaseAcasClientTest, TEST_DATA_DIR
 
 
 logger = logging.getLogger(__name__)
@@ -35,6 +37,11 @@ class TestLsThing(BaseAcasClientTest):
 
     # See test_acasclient.BaseAcasClientTest for setUp
 
+    def setUp(self):
+        super().setUp()
+        # One start date per test so every project a test builds shares it
+        self.start_date = datetime.now()
+
     def tearDown(self):
         """Tear down test fixtures, if any."""
         files_to_delete = ['dummy.pdf', 'dummy2.PDF']
@@ -46,15 +53,41 @@ class TestLsThing(BaseAcasClientTest):
 
     # Helpers
     def _get_path(self, file_name):
-        path = Path(__file__).resolve().parent\
-            .joinpath('test_acasclient', file_name)
-        return path
+        return TEST_DATA_DIR.joinpath(file_name)
 
     def _get_bytes(self, file_path):
         with open(file_path, "rb") as in_file:
             file_bytes = in_file.read()
         return file_bytes
 
+    # Test data files never change during a run so read each one from disk only once
+    _test_file_bytes_cache = {}
+
+    def _get_test_file_bytes(self, file_path):
+        key = os.fspath(file_path)
+        if key not in self._test_file_bytes_cache:
+            self._test_file_bytes_cache[key] = self._get_bytes(file_path)
+        return self._test_file_bytes_cache[key]
+
+    def _get_meta_dict(self, name, status=ACTIVE, extra=None):
+        # Metadata for a restricted project, which most tests start from
+        meta_dict = {
+            NAME_KEY: name,
+            IS_RESTRICTED_KEY: True,
+            STATUS_KEY: status,
+            START_DATE_KEY: self.start_date
+        }
+        if extra:
+            meta_dict.update(extra)
+        return meta_dict
+
+    def _save_concurrently(self, *ls_things, **save_kwargs):
+        # The things are independent so save them concurrently, re-raising any save error
+        with ThreadPoolExecutor(max_workers=len(ls_things)) as executor:
+            futures = [executor.submit(ls_thing.save, self.client, **save_kwargs) for ls_thing in ls_things]
+        for future in futures:
+            future.result()
+
     def _check_blob_equal(self, blob_value, orig_file_name, orig_bytes):
         self.assertEqual(blob_value.comments, orig_file_name)
         data = blob_value.download_data(self.client)
@@ -63,10 +96,11 @@ class TestLsThing(BaseAcasClientTest):
     def _check_file(self, file_path, orig_file_name, orig_file_path):
         # Check file names match
         self.assertEqual(Path(file_path).name, orig_file_name)
-        # Check file contents match
-        new_bytes = self._get_bytes(file_path)
-        orig_bytes = self._get_bytes(orig_file_path)
-        self.assertEqual(new_bytes, orig_bytes)
+        # Check file contents match, comparing in chunks and stopping at the first difference
+        # Downloads are rewritten at the same path so clear filecmp's stat-keyed cache first
+        filecmp.clear_cache()
+        self.assertTrue(filecmp.cmp(file_path, orig_file_path, shallow=False),
+                        f"{file_path} does not match {orig_file_path}")
 
     def _test_codevalue_missing_error(self, message, value, code_type, code_kind, code_origin):
         base_msg = "'{code}' is not yet in the database as a valid '{code_kind}'. Please double-check the spelling and correct your data if you expect this to match an existing term. If this is a novel valid term, please contact your administrator to add it to the following dictionary: Code Type: {code_type}, Code Kind: {code_kind}, Code Origin: {code_origin}"
@@ -77,13 +111,8 @@ class TestLsThing(BaseAcasClientTest):
     # Tests
     def test_000_simple_ls_thing_save(self):
         """Test saving simple ls thing."""
-        name = str(uuid.uuid4())
-        meta_dict = {
-            NAME_KEY: name,
-            IS_RESTRICTED_KEY: True,
-            STATUS_KEY: ACTIVE,
-            START_DATE_KEY: datetime.now()
-        }
+        name = uuid.uuid4().hex
+        meta_dict = self._get_meta_dict(name)
         newProject = Project(recorded_by=self.client.username, **meta_dict)
         self.assertIsNone(newProject.code_name)
         self.assertIsNone(newProject._ls_thing.id)
@@ -93,122 +122,78 @@ class TestLsThing(BaseAcasClientTest):
 
     def test_001_simple_ls_thing_save_with_blob_value(self):
         """Test saving simple ls thing with blob value."""
-        name = str(uuid.uuid4())
+        name = uuid.uuid4().hex
         file_name = 'blob_test.png'
-        blob_test_path = Path(__file__).resolve().parent\
-            .joinpath('test_acasclient', file_name)
+        blob_test_path = self._get_path(file_name)
 
         # Get the file bytes for testing
-        in_file = open(blob_test_path, "rb")
-        file_bytes = in_file.read()
-        in_file.close()
+        file_bytes = self._get_test_file_bytes(blob_test_path)
 
         # Save with Path path
-        meta_dict = {
-            NAME_KEY: name,
-            IS_RESTRICTED_KEY: True,
-            STATUS_KEY: ACTIVE,
-            START_DATE_KEY: datetime.now(),
-            PROCEDURE_DOCUMENT_KEY: blob_test_path
-        }
+        meta_dict = self._get_meta_dict(name, extra={PROCEDURE_DOCUMENT_KEY: blob_test_path})
         newProject = Project(recorded_by=self.client.username, **meta_dict)
         newProject.save(self.client)
         self._check_blob_equal(newProject.metadata[PROJECT_METADATA][PROCEDURE_DOCUMENT], file_name, file_bytes)
 
         # Save with string path
-        meta_dict = {
-            NAME_KEY: name,
-            IS_RESTRICTED_KEY: True,
-            STATUS_KEY: ACTIVE,
-            START_DATE_KEY: datetime.now(),
-            PROCEDURE_DOCUMENT_KEY: str(blob_test_path)
-        }
+        meta_dict = self._get_meta_dict(name, extra={PROCEDURE_DOCUMENT_KEY: str(blob_test_path)})
         newProject = Project(recorded_by=self.client.username, **meta_dict)
         newProject.save(self.client)
-        self._check_blob_equal(newProject.metadata[PROJECT_METADATA][PROCEDURE_DOCUMENT], file_name, file_bytes)
+        procedure_document = newProject.metadata[PROJECT_METADATA][PROCEDURE_DOCUMENT]
+        self._check_blob_equal(procedure_document, file_name, file_bytes)
 
         # Write to a file by providing a full file path
         custom_file_name = "my.png"
-        output_file = newProject.metadata[PROJECT_METADATA][PROCEDURE_DOCUMENT].write_to_file(full_file_path=Path(self.tempdir, custom_file_name))
+        output_file = procedure_document.write_to_file(full_file_path=Path(self.tempdir, custom_file_name))
         self.assertTrue(output_file.exists())
         self.assertEqual(output_file.name, custom_file_name)
 
         # Write to a file by providing a full file path as a string
         custom_file_name = "my.png"
-        output_file = newProject.metadata[PROJECT_METADATA][PROCEDURE_DOCUMENT].write_to_file(full_file_path=str(Path(self.tempdir, custom_file_name)))
+        output_file = procedure_document.write_to_file(full_file_path=os.path.join(self.tempdir, custom_file_name))
         self.assertTrue(output_file.exists())
         self.assertEqual(output_file.name, custom_file_name)
 
         # Write to a file by providing a folder
-        output_file = newProject.metadata[PROJECT_METADATA][PROCEDURE_DOCUMENT].write_to_file(folder_path=self.tempdir)
+        output_file = procedure_document.write_to_file(folder_path=self.tempdir)
         self.assertTrue(output_file.exists())
         self.assertEqual(output_file.name, file_name)
 
         # Write to a file by providing a folder as a string
-        output_file = newProject.metadata[PROJECT_METADATA][PROCEDURE_DOCUMENT].write_to_file(folder_path=str(self.tempdir))
+        output_file = procedure_document.write_to_file(folder_path=str(self.tempdir))
         self.assertTrue(output_file.exists())
         self.assertEqual(output_file.name, file_name)
 
         # Write to a file by providing a folder and custom file name
-        output_file = newProject.metadata[PROJECT_METADATA][PROCEDURE_DOCUMENT].write_to_file(folder_path=self.tempdir, file_name=custom_file_name)
+        output_file = procedure_document.write_to_file(folder_path=self.tempdir, file_name=custom_file_name)
         self.assertTrue(output_file.exists())
         self.assertEqual(output_file.name, custom_file_name)
 
         # Write to a bad folder path fails gracefully
-        with self.assertRaises(ValueError):
-            output_file = newProject.metadata[PROJECT_METADATA][PROCEDURE_DOCUMENT].write_to_file(folder_path="GARBAGE")
-        try:
-            output_file = newProject.metadata[PROJECT_METADATA][PROCEDURE_DOCUMENT].write_to_file(folder_path="GARBAGE")
-        except ValueError as err:
-            self.assertIn("does not exist", err.args[0])
+        with self.assertRaisesRegex(ValueError, "does not exist"):
+            output_file = procedure_document.write_to_file(folder_path="GARBAGE")
 
         # Make sure a bad path fails gracefully
-        meta_dict = {
-            NAME_KEY: name,
-            IS_RESTRICTED_KEY: True,
-            STATUS_KEY: ACTIVE,
-            START_DATE_KEY: datetime.now(),
-            PROCEDURE_DOCUMENT_KEY: "SOMEGARBAGEPATH"
-        }
-        with self.assertRaises(ValueError):
-            newProject = Project(recorded_by=self.client.username, **meta_dict)
-        try:
+        meta_dict = self._get_meta_dict(name, extra={PROCEDURE_DOCUMENT_KEY: "SOMEGARBAGEPATH"})
+        with self.assertRaisesRegex(ValueError, "does not exist"):
             newProject = Project(recorded_by=self.client.username, **meta_dict)
-        except ValueError as err:
-            self.assertIn("does not exist", err.args[0])
 
         # Make sure passing a directory fails gracefully
-        meta_dict = {
-            NAME_KEY: name,
-            IS_RESTRICTED_KEY: True,
-            STATUS_KEY: ACTIVE,
-            START_DATE_KEY: datetime.now(),
-            PROCEDURE_DOCUMENT_KEY: self.tempdir
-        }
-        with self.assertRaises(ValueError):
+        meta_dict = self._get_meta_dict(name, extra={PROCEDURE_DOCUMENT_KEY: self.tempdir})
+        with self.assertRaisesRegex(ValueError, "not a file"):
             newProject = Project(recorded_by=self.client.username, **meta_dict)
-        try:
-            newProject = Project(recorded_by=self.client.username, **meta_dict)
-        except ValueError as err:
-            self.assertIn("not a file", err.args[0])
 
     def test_002_update_blob_value(self):
         """Test saving simple ls thing with blob value, then updating the blobValue."""
 
         # Create a project with first blobValue
-        name = str(uuid.uuid4())
+        name = uuid.uuid4().hex
         file_name = 'blob_test.png'
         file_path = self._get_path(file_name)
-        file_bytes = self._get_bytes(file_path)
+        file_bytes = self._get_test_file_bytes(file_path)
 
         # Save with Path path
-        meta_dict = {
-            NAME_KEY: name,
-            IS_RESTRICTED_KEY: True,
-            STATUS_KEY: ACTIVE,
-            START_DATE_KEY: datetime.now(),
-            PROCEDURE_DOCUMENT_KEY: file_path
-        }
+        meta_dict = self._get_meta_dict(name, extra={PROCEDURE_DOCUMENT_KEY: file_path})
         newProject = Project(recorded_by=self.client.username, **meta_dict)
         newProject.save(self.client)
         self._check_blob_equal(newProject.metadata[PROJECT_METADATA][PROCEDURE_DOCUMENT], file_name, file_bytes)
@@ -216,7 +201,7 @@ class TestLsThing(BaseAcasClientTest):
         # Then update with a different file
         file_name = '1_1_Generic.xlsx'
         file_path = self._get_path(file_name)
-        file_bytes = self._get_bytes(file_path)
+        file_bytes = self._get_test_file_bytes(file_path)
         new_blob_val = BlobValue(file_path=file_path)
         newProject.metadata[PROJECT_METADATA][PROCEDURE_DOCUMENT] = new_blob_val
         newProject.save(self.client)
@@ -224,22 +209,14 @@ class TestLsThing(BaseAcasClientTest):
 
     def test_003_simple_ls_thing_save_with_file_value(self):
         """Test saving simple ls thing with file value."""
-        name = str(uuid.uuid4())
+        name = uuid.uuid4().hex
         file_name = 'dummy.pdf'
-        file_test_path = Path(__file__).resolve().parent\
-            .joinpath('test_acasclient', file_name)
+        file_test_path = self._get_path(file_name)
         file_name_2 = 'dummy2.PDF'
-        file_test_path_2 = Path(__file__).resolve().parent\
-            .joinpath('test_acasclient', file_name_2)
+        file_test_path_2 = self._get_path(file_name_2)
 
         # Save with Path value
-        meta_dict = {
-            NAME_KEY: name,
-            IS_RESTRICTED_KEY: True,
-            STATUS_KEY: ACTIVE,
-            START_DATE_KEY: datetime.now(),
-            PDF_DOCUMENT_KEY: file_test_path
-        }
+        meta_dict = self._get_meta_dict(name, extra={PDF_DOCUMENT_KEY: file_test_path})
         newProject = Project(recorded_by=self.client.username, **meta_dict)
         newProject.save(self.client)
         # Write file locally and compare
@@ -248,13 +225,7 @@ class TestLsThing(BaseAcasClientTest):
         self._check_file(downloaded_path, file_name, file_test_path)
 
         # Save with string value
-        meta_dict = {
-            NAME_KEY: name,
-            IS_RESTRICTED_KEY: True,
-            STATUS_KEY: ACTIVE,
-            START_DATE_KEY: datetime.now(),
-            PDF_DOCUMENT_KEY: str(file_test_path)
-        }
+        meta_dict = self._get_meta_dict(name, extra={PDF_DOCUMENT_KEY: str(file_test_path)})
         newProject = Project(recorded_by=self.client.username, **meta_dict)
         newProject.save(self.client)
         # Write file locally and compare
@@ -263,16 +234,12 @@ class TestLsThing(BaseAcasClientTest):
         self._check_file(downloaded_path, file_name, file_test_path)
 
         # Save with Path file_path
-        meta_dict = {
-            NAME_KEY: name,
-            IS_RESTRICTED_KEY: True,
-            STATUS_KEY: ACTIVE,
-            START_DATE_KEY: datetime.now(),
-        }
+        meta_dict = self._get_meta_dict(name)
         newProject = Project(recorded_by=self.client.username, **meta_dict)
-        newProject.metadata[PROJECT_METADATA][PDF_DOCUMENT] = FileValue(file_path=file_test_path)
-        self.assertIsNotNone(newProject.metadata[PROJECT_METADATA][PDF_DOCUMENT].value)
-        self.assertIsNotNone(newProject.metadata[PROJECT_METADATA][PDF_DOCUMENT].comments)
+        fv = FileValue(file_path=file_test_path)
+        newProject.metadata[PROJECT_METADATA][PDF_DOCUMENT] = fv
+        self.assertIsNotNone(fv.value)
+        self.assertIsNotNone(fv.comments)
         newProject.save(self.client)
         # Write file locally and compare
         fv = newProject.metadata[PROJECT_METADATA][PDF_DOCUMENT]
@@ -280,16 +247,12 @@ class TestLsThing(BaseAcasClientTest):
         self._check_file(downloaded_path, file_name, file_test_path)
 
         # Save with string file_path
-        meta_dict = {
-            NAME_KEY: name,
-            IS_RESTRICTED_KEY: True,
-            STATUS_KEY: ACTIVE,
-            START_DATE_KEY: datetime.now(),
-        }
+        meta_dict = self._get_meta_dict(name)
         newProject = Project(recorded_by=self.client.username, **meta_dict)
-        newProject.metadata[PROJECT_METADATA][PDF_DOCUMENT] = FileValue(file_path=str(file_test_path))
-        self.assertIsNotNone(newProject.metadata[PROJECT_METADATA][PDF_DOCUMENT].value)
-        self.assertIsNotNone(newProject.metadata[PROJECT_METADATA][PDF_DOCUMENT].comments)
+        fv = FileValue(file_path=str(file_test_path))
+        newProject.metadata[PROJECT_METADATA][PDF_DOCUMENT] = fv
+        self.assertIsNotNone(fv.value)
+        self.assertIsNotNone(fv.comments)
         newProject.save(self.client)
         # Write file locally and compare
         fv = newProject.metadata[PROJECT_METADATA][PDF_DOCUMENT]
@@ -297,12 +260,8 @@ class TestLsThing(BaseAcasClientTest):
         self._check_file(downloaded_path, file_name, file_test_path)
 
         # Write to a bad folder path fails gracefully
-        with self.assertRaises(ValueError):
-            fv.download_to_disk(self.client, folder_path="GARBAGE")
-        try:
+        with self.assertRaisesRegex(ValueError, "does not exist"):
             fv.download_to_disk(self.client, folder_path="GARBAGE")
-        except ValueError as err:
-            self.assertIn("does not exist", err.args[0])
 
         # Test updating other values on a saved Thing
         saved_project = Project.get_by_code(newProject.code_name, self.client, Project.ls_type, Project.ls_kind)
@@ -311,7 +270,7 @@ class TestLsThing(BaseAcasClientTest):
         saved_project.save(self.client)
 
         # Test updating FileValue on a saved Thing
-        saved_project = Project.get_by_code(newProject.code_name, self.client, Project.ls_type, Project.ls_kind)
+        # save repopulates saved_project from the server response so it does not need to be fetched again
         saved_project.metadata[PROJECT_METADATA][PDF_DOCUMENT] = FileValue(file_path=file_test_path_2)
         saved_project.save(self.client)
         fv = saved_project.metadata[PROJECT_METADATA][PDF_DOCUMENT]
@@ -334,7 +293,7 @@ class TestLsThing(BaseAcasClientTest):
         assert len(lskind_to_lsvalue) == 1
         assert 'bar' in lskind_to_lsvalue
 
-        # No unit_kind in LsThingValue
+        # unit_kind in LsThingValue
         lsthing_value = LsThingValue(
             ls_type='foo',
             ls_kind='bar',
@@ -345,24 +304,13 @@ class TestLsThing(BaseAcasClientTest):
         assert 'bar (baz)' in lskind_to_lsvalue
 
     def test_005_create_interactions(self):
-        name = str(uuid.uuid4())
-        meta_dict = {
-            NAME_KEY: name,
-            IS_RESTRICTED_KEY: True,
-            STATUS_KEY: ACTIVE,
-            START_DATE_KEY: datetime.now()
-        }
-        name_2 = str(uuid.uuid4())
-        meta_dict_2 = {
-            NAME_KEY: name_2,
-            IS_RESTRICTED_KEY: True,
-            STATUS_KEY: ACTIVE,
-            START_DATE_KEY: datetime.now()
-        }
+        name = uuid.uuid4().hex
+        meta_dict = self._get_meta_dict(name)
+        name_2 = uuid.uuid4().hex
+        meta_dict_2 = self._get_meta_dict(name_2)
         proj_1 = Project(recorded_by=self.client.username, **meta_dict)
-        proj_1.save(self.client)
         proj_2 = Project(recorded_by=self.client.username, **meta_dict_2)
-        proj_2.save(self.client)
+        self._save_concurrently(proj_1, proj_2)
         # add an interaction
         proj_1.add_link(FWD_ITX, proj_2, recorded_by=self.client.username)
         assert len(proj_1.links) == 1
@@ -397,7 +345,7 @@ class TestLsThing(BaseAcasClientTest):
             .advanced_search_ls_things('project', 'project', None,
                                        second_itx_listings=second_itx_listings,
                                        codes_only=True,
-                                       max_results=1000,
+                                       max_results=2,
                                        combine_terms_with_and=True)
         assert len(results) == 1
         assert results[0] == proj_1.code_name
@@ -414,20 +362,19 @@ class TestLsThing(BaseAcasClientTest):
             .advanced_search_ls_things('project', 'project', None,
                                        first_itx_listings=first_itx_listings,
                                        codes_only=True,
-                                       max_results=1000,
+                                       max_results=2,
                                        combine_terms_with_and=True)
         assert len(results) == 1
         assert results[0] == proj_2.code_name
 
         # Save new ls things to test interaction subject and object type customization
-        name_3 = str(uuid.uuid4())
-        name_4 = str(uuid.uuid4())
+        name_3 = uuid.uuid4().hex
+        name_4 = uuid.uuid4().hex
         meta_dict.update({'name': name_3})
         meta_dict_2.update({'name': name_4})
         proj_1 = Project(recorded_by=self.client.username, **meta_dict)
-        proj_1.save(self.client)
         proj_2 = Project(recorded_by=self.client.username, **meta_dict_2)
-        proj_2.save(self.client)
+        self._save_concurrently(proj_1, proj_2)
         # add an interaction and override the subject and object types
         subject_type = 'test'
         object_type = 'me'
@@ -462,8 +409,8 @@ class TestLsThing(BaseAcasClientTest):
                 super().__init__(ls_type=self.ls_type, ls_kind=self.ls_kind, names=names, aliases=aliases, ids=ids, recorded_by=recorded_by,
                                  metadata=metadata, results=results, ls_thing=ls_thing)
 
-        name = str(uuid.uuid4())
-        alias = str(uuid.uuid4())
+        name = uuid.uuid4().hex
+        alias = uuid.uuid4().hex
         meta_dict = {
             'alias': alias,
             'name': name,
@@ -497,64 +444,24 @@ class TestLsThing(BaseAcasClientTest):
         # The label sequence for example thing is in the format ET-000001 so check it fetched a new label and is in the ids field
         assert fresh_example_thing.ids['Example Thing'].startswith('ET-')
 
-    def test_004_get_lskind_to_ls_values(self):
-        """
-        Verify `get_lskind_to_lsvalue` adds the `unit_kind` if present to the
-        `lskind` value.
-        """
-
-        # No unit_kind in LsThingValue
-        lsthing_value = LsThingValue(
-            ls_type='foo',
-            ls_kind='bar',
-            numeric_value=4.5,
-        )
-        lskind_to_lsvalue = get_lsKind_to_lsvalue([lsthing_value])
-        assert len(lskind_to_lsvalue) == 1
-        assert 'bar' in lskind_to_lsvalue
-
-        # No unit_kind in LsThingValue
-        lsthing_value = LsThingValue(
-            ls_type='foo',
-            ls_kind='bar',
-            numeric_value=4.5,
-            unit_kind='baz')
-        lskind_to_lsvalue = get_lsKind_to_lsvalue([lsthing_value])
-        assert len(lskind_to_lsvalue) == 1
-        assert 'bar (baz)' in lskind_to_lsvalue
-
     def test_007_advanced_search_interactions(self):
 
         # Create project 1
-        name = str(uuid.uuid4())
-        status_1 = str(uuid.uuid4())
-        desc_1 = str(uuid.uuid4())
-        meta_dict = {
-            NAME_KEY: name,
-            IS_RESTRICTED_KEY: True,
-            STATUS_KEY: status_1,
-            START_DATE_KEY: datetime.now(),
-            DESCRIPTION_KEY: desc_1
-        }
+        name = uuid.uuid4().hex
+        status_1 = uuid.uuid4().hex
+        desc_1 = uuid.uuid4().hex
+        meta_dict = self._get_meta_dict(name, status=status_1, extra={DESCRIPTION_KEY: desc_1})
 
         proj_1 = Project(recorded_by=self.client.username, **meta_dict)
-        # skip CodeValue validation since this is not a valid status
-        proj_1.save(self.client, skip_validation=True)
 
         # Create project 2
-        name_2 = str(uuid.uuid4())
-        status_2 = str(uuid.uuid4())
-        desc_2 = str(uuid.uuid4())
-        meta_dict_2 = {
-            NAME_KEY: name_2,
-            IS_RESTRICTED_KEY: True,
-            STATUS_KEY: status_2,
-            START_DATE_KEY: datetime.now(),
-            DESCRIPTION_KEY: desc_2
-        }
+        name_2 = uuid.uuid4().hex
+        status_2 = uuid.uuid4().hex
+        desc_2 = uuid.uuid4().hex
+        meta_dict_2 = self._get_meta_dict(name_2, status=status_2, extra={DESCRIPTION_KEY: desc_2})
         proj_2 = Project(recorded_by=self.client.username, **meta_dict_2)
-        # skip CodeValue validation since this is not a valid status
-        proj_2.save(self.client, skip_validation=True)
+        # skip CodeValue validation since these are not valid statuses
+        self._save_concurrently(proj_1, proj_2, skip_validation=True)
 
         # Add interactions between projects
         proj_1.add_link(FWD_ITX, proj_2, recorded_by=self.client.username)
@@ -587,7 +494,7 @@ class TestLsThing(BaseAcasClientTest):
             .advanced_search_ls_things('project', 'project', None,
                                        second_itx_listings=second_itx_listings,
                                        format="nestedfull",
-                                       max_results=1000,
+                                       max_results=2,
                                        combine_terms_with_and=True)
         assert len(results) == 1
         assert results[0]["codeName"] == proj_1.code_name
@@ -615,7 +522,7 @@ class TestLsThing(BaseAcasClientTest):
             .advanced_search_ls_things('project', 'project', None,
                                        second_itx_listings=second_itx_listings,
                                        format="nestedfull",
-                                       max_results=1000,
+                                       max_results=2,
                                        combine_terms_with_and=True)
         assert len(results) == 1
         assert results[0]["codeName"] == proj_1.code_name
@@ -643,7 +550,7 @@ class TestLsThing(BaseAcasClientTest):
             .advanced_search_ls_things('project', 'project', None,
                                        second_itx_listings=second_itx_listings,
                                        format="nestedfull",
-                                       max_results=1000,
+                                       max_results=2,
                                        combine_terms_with_and=True)
         assert len(results) == 1
         assert results[0]["codeName"] == proj_1.code_name
@@ -671,7 +578,7 @@ class TestLsThing(BaseAcasClientTest):
             .advanced_search_ls_things('project', 'project', None,
                                        second_itx_listings=second_itx_listings,
                                        format="nestedfull",
-                                       max_results=1000,
+                                       max_results=2,
                                        combine_terms_with_and=True)
         assert len(results) == 0
 
@@ -680,16 +587,10 @@ class TestLsThing(BaseAcasClientTest):
         Confirm that invalid code values are rejected by validate method.
         """
         # Create project 1
-        name = str(uuid.uuid4())
-        status_1 = str(uuid.uuid4())
-        desc_1 = str(uuid.uuid4())
-        meta_dict = {
-            NAME_KEY: name,
-            IS_RESTRICTED_KEY: True,
-            STATUS_KEY: status_1,
-            START_DATE_KEY: datetime.now(),
-            DESCRIPTION_KEY: desc_1
-        }
+        name = uuid.uuid4().hex
+        status_1 = uuid.uuid4().hex
+        desc_1 = uuid.uuid4().hex
+        meta_dict = self._get_meta_dict(name, status=status_1, extra={DESCRIPTION_KEY: desc_1})
         proj_1 = Project(recorded_by=self.client.username, **meta_dict)
         valid = proj_1.validate(self.client)
         assert not valid
@@ -719,12 +620,12 @@ class TestLsThing(BaseAcasClientTest):
         Confirm that invalid code values are rejected by validate method.
         """
         # Create project 1
-        name = str(uuid.uuid4())
-        desc_1 = str(uuid.uuid4())
+        name = uuid.uuid4().hex
+        desc_1 = uuid.uuid4().hex
         meta_dict = {
             NAME_KEY: name,
             IS_RESTRICTED_KEY: True,
-            START_DATE_KEY: datetime.now(),
+            START_DATE_KEY: self.start_date,
             DESCRIPTION_KEY: desc_1
         }
 
@@ -737,7 +638,7 @@ class TestLsThing(BaseAcasClientTest):
         assert valid
         assert len(valid.get_messages()) == 0
         # Now try setting status to an invalid CodeValue
-        status_1 = str(uuid.uuid4())
+        status_1 = uuid.uuid4().hex
         proj_1.metadata[PROJECT_METADATA][PROJECT_STATUS] = CodeValue(status_1, ddict=STATUS_DDICT)
         valid = proj_1.validate(self.client)
         assert not valid
@@ -748,13 +649,13 @@ class TestLsThing(BaseAcasClientTest):
         proj_1.metadata[PROJECT_METADATA][PROJECT_STATUS] = CodeValue(ACTIVE, ddict=STATUS_DDICT)
         proj_1.save(self.client)
         # Then we create a new project 2 and set PARENT_PROJECT_KEY to reference `proj_1`
-        name_2 = str(uuid.uuid4())
-        desc_2 = str(uuid.uuid4())
+        name_2 = uuid.uuid4().hex
+        desc_2 = uuid.uuid4().hex
         PARENT_PROJECT_DDICT = ACASLsThingDDict(PROJECT, PROJECT)
         meta_dict = {
             NAME_KEY: name_2,
             IS_RESTRICTED_KEY: True,
-            START_DATE_KEY: datetime.now(),
+            START_DATE_KEY: self.start_date,
             DESCRIPTION_KEY: desc_2
         }
         proj_2 = Project(recorded_by=self.client.username, **meta_dict)
@@ -763,7 +664,7 @@ class TestLsThing(BaseAcasClientTest):
         valid = proj_2.validate(self.client)
         assert valid
         # Now try setting parent project to an invalid CodeValue and confirm validation fails
-        bad_project_code = str(uuid.uuid4())
+        bad_project_code = uuid.uuid4().hex
         proj_2.metadata[PROJECT_METADATA][PARENT_PROJECT_KEY] = CodeValue(bad_project_code, ddict=PARENT_PROJECT_DDICT)
         valid = proj_2.validate(self.client)
         assert not valid
@@ -785,7 +686,7 @@ class TestLsThing(BaseAcasClientTest):
         assert bad_project_code in validation_response['results']['htmlSummary']
 
 
-    def test_008_get_by_code(self):
+    def test_010_get_by_code(self):
         """
         If no lsthing entry is found for the given `code_name`, `ls_type` and
         `ls_kind` then `get_by_code` should raise KeyError.
@@ -796,12 +697,12 @@ class TestLsThing(BaseAcasClientTest):
             ls_type='foo', ls_kind='bar')
 
 
-    def test_009_advanced_search_flat_response(self):
+    def test_011_advanced_search_flat_response(self):
 
         # Create project 1
-        name = str(uuid.uuid4())
-        status_1 = str(uuid.uuid4())
-        desc_1 = str(uuid.uuid4())
+        name = uuid.uuid4().hex
+        status_1 = uuid.uuid4().hex
+        desc_1 = uuid.uuid4().hex
         start_date = datetime.now()
         project_number = 1234
         meta_dict = {
@@ -981,7 +882,7 @@ class TestCodeValue(BaseAcasClientTest):
         assert code_value.code == code
         assert code_value.code_origin is None
         # Construct a basic SimpleLsThing object and save it
-        name = str(uuid.uuid4())
+        name = uuid.uuid4().hex
         meta_dict = {
             NAME_KEY: name,
             IS_RESTRICTED_KEY: True,
@@ -1147,7 +1048,7 @@ class TestProtocol(BaseAcasClientTest):
         Test creating a protocol with a few different types of values.
         """
         # Create a protocol
-        name = str(uuid.uuid4())
+        name = uuid.uuid4().hex
         scientist = self.client.username
         recorded_by = scientist
         protocol = Protocol(name=name, recorded_by=recorded_by, scientist=scientist)